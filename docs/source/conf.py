@@ -20,13 +20,17 @@
 # import sys
 # sys.path.insert(0, os.path.abspath('.'))
 
+import functools
+import hashlib
 import os
+import re
 import sys
 import textwrap
 from copy import copy
 from pathlib import Path
 
 import pytorch_sphinx_theme
+import sphinx_gallery
 import torchvision
 import torchvision.models as M
 from sphinx_gallery.sorting import ExplicitOrder
@@ -115,8 +119,19 @@ sphinx_gallery_conf = {
     "remove_config_comments": True,
     "ignore_pattern": "helpers.py",
     "within_subsection_order": CustomGalleryExampleSortKey,
+    "filename_pattern": "/plot_",
+    # Only re-execute examples whose source md5 changed since the last build
+    "run_stale_examples": False,
 }
 
+if os.environ.get("TORCHVISION_DOCS_FAST"):
+    # Same as `make html-noplot`: build the gallery pages without executing the examples
+    sphinx_gallery_conf["plot_gallery"] = "False"
+
+if tuple(int(v) for v in sphinx_gallery.__version__.split(".")[:2]) >= (0, 17):
+    # Run the gallery examples concurrently, matching the -j auto used for the rest of the build (see Makefile)
+    sphinx_gallery_conf["parallel"] = -1
+
 napoleon_use_ivar = True
 napoleon_numpy_docstring = False
 napoleon_google_docstring = True
@@ -212,7 +227,12 @@ html_css_files = [
 htmlhelp_basename = "PyTorchdoc"
 
 
-autosummary_generate = True
+# Only hand autosummary the documents that actually use it, instead of every source file
+autosummary_generate = sorted(
+    str(path.relative_to(Path(__file__).parent))
+    for path in Path(__file__).parent.glob("**/*.rst")
+    if ".. autosummary::" in path.read_text(encoding="utf-8")
+)
 
 
 # -- Options for LaTeX output ---------------------------------------------
@@ -282,6 +302,15 @@ from sphinx import addnodes
 from sphinx.util.docfields import TypedField
 
 
+_TYPE_REWRITES = {"int": "python:int", "long": "python:long", "float": "python:float", "type": "python:type"}
+_TYPE_REWRITES_RE = re.compile(r"\b(" + "|".join(map(re.escape, _TYPE_REWRITES)) + r")\b")
+
+
+@functools.lru_cache(maxsize=4096)
+def _rewrite_typename(typename):
+    return _TYPE_REWRITES_RE.sub(lambda m: _TYPE_REWRITES[m.group(1)], typename)
+
+
 def patched_make_field(self, types, domain, items, **kw):
     # `kw` catches `env=None` needed for newer sphinx while maintaining
     #  backwards compatibility when passed along further down!
@@ -299,11 +328,7 @@ def patched_make_field(self, types, domain, items, **kw):
             # inconsistencies later when references are resolved
             fieldtype = types.pop(fieldarg)
             if len(fieldtype) == 1 and isinstance(fieldtype[0], nodes.Text):
-                typename = "".join(n.astext() for n in fieldtype)
-                typename = typename.replace("int", "python:int")
-                typename = typename.replace("long", "python:long")
-                typename = typename.replace("float", "python:float")
-                typename = typename.replace("type", "python:type")
+                typename = _rewrite_typename("".join(n.astext() for n in fieldtype))
                 par.extend(self.make_xrefs(self.typerolename, domain, typename, addnodes.literal_emphasis, **kw))
             else:
                 par += fieldtype
@@ -445,6 +470,20 @@ def generate_weights_table(module, table_name, metrics, dataset, include_pattern
     if exclude_patterns is not None:
         weights = [w for w in weights if all(p not in str(w) for p in exclude_patterns)]
 
+    generated_dir = Path("generated")
+    table_file_path = generated_dir / f"{table_name}_table.rst"
+    checksum_path = generated_dir / f"{table_name}_table.md5"
+    # The meta fields shown in the table are part of the checksum, so that updated numbers are always picked up
+    weights_summary = [
+        (str(w), w.meta["_metrics"][dataset], w.meta["num_params"], w.meta["_ops"], w.meta["recipe"]) for w in weights
+    ]
+    checksum = hashlib.md5(
+        repr((torchvision.__version__, metrics, dataset, include_patterns, exclude_patterns, weights_summary)).encode()
+    ).hexdigest()
+    if table_file_path.exists() and checksum_path.exists() and checksum_path.read_text() == checksum:
+        # Nothing changed since the last build
+        return
+
     ops_name = "GIPS" if "QuantizedWeights" in weights_endswith else "GFLOPS"
 
     metrics_keys, metrics_names = zip(*metrics)
@@ -453,12 +492,14 @@ def generate_weights_table(module, table_name, metrics, dataset, include_pattern
 
     content = []
     for w in weights:
+        meta = w.meta
+        dataset_metrics = meta["_metrics"][dataset]
         row = [
             f":class:`{w} <{type(w).__name__}>`",
-            *(w.meta["_metrics"][dataset][metric] for metric in metrics_keys),
-            f"{w.meta['num_params']/1e6:.1f}M",
-            f"{w.meta['_ops']:.2f}",
-            f"`link <{w.meta['recipe']}>`__",
+            *(dataset_metrics[metric] for metric in metrics_keys),
+            f"{meta['num_params']/1e6:.1f}M",
+            f"{meta['_ops']:.2f}",
+            f"`link <{meta['recipe']}>`__",
         ]
 
         content.append(row)
@@ -468,13 +509,13 @@ def generate_weights_table(module, table_name, metrics, dataset, include_pattern
 
     table = tabulate(content, headers=column_names, tablefmt="rst")
 
-    generated_dir = Path("generated")
     generated_dir.mkdir(exist_ok=True)
-    with open(generated_dir / f"{table_name}_table.rst", "w+") as table_file:
+    with open(table_file_path, "w+") as table_file:
         table_file.write(".. rst-class:: table-weights\n")  # Custom CSS class, see custom_torchvision.css
         table_file.write(".. table::\n")
         table_file.write(f"    :widths: {widths_table} \n\n")
         table_file.write(f"{textwrap.indent(table, ' ' * 4)}\n\n")
+    checksum_path.write_text(checksum)
 
 
 generate_weights_table(
@@ -522,3 +563,8 @@ def setup(app):
 
     app.connect("autodoc-process-docstring", inject_minigalleries)
     app.connect("autodoc-process-docstring", inject_weight_metadata)
+    return {
+        "version": torchvision.__version__,
+        "parallel_read_safe": True,
+        "parallel_write_safe": True,
+    }
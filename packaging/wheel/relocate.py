@@ -2,6 +2,7 @@
 
 import glob
 import hashlib
+import mmap
 
 # Standard library imports
 import os
@@ -10,8 +11,11 @@ import platform
 import shutil
 import subprocess
 import sys
+import threading
 import zipfile
 from base64 import urlsafe_b64encode
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 # Third party imports
 if sys.platform == "linux":
@@ -57,6 +61,11 @@ WINDOWS_ALLOWLIST = {
     "api-ms-win-crt-convert-l1-1-0.dll",
 }
 
+# Files that are already compressed and barely shrink under DEFLATE. Shared libraries are not among them: they
+# typically shrink by more than half, so they are always deflated.
+STORED_EXTENSIONS = (".png", ".jpg", ".jpeg", ".zip", ".whl")
+# ioctl request number to reflink a whole file, from linux/fs.h
+FICLONE = 0x40049409
 
 HERE = osp.dirname(osp.abspath(__file__))
 PACKAGE_ROOT = osp.dirname(osp.dirname(HERE))
@@ -64,23 +73,85 @@ PLATFORM_ARCH = platform.machine()
 PYTHON_VERSION = sys.version_info
 
 
-def rehash(path, blocksize=1 << 20):
+def rehash(path, blocksize=1 << 20, mmap_threshold=16 << 20):
     """Return (hash, length) for path using hashlib.sha256()"""
-    h = hashlib.sha256()
-    length = 0
     with open(path, "rb") as f:
-        while block := f.read(blocksize):
-            length += len(block)
-            h.update(block)
+        if os.fstat(f.fileno()).st_size >= mmap_threshold:
+            # Large files (e.g. relocated libraries) are hashed straight from the page cache
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h = hashlib.sha256(mm)
+                length = len(mm)
+        elif hasattr(hashlib, "file_digest"):
+            # Python 3.11+: hash straight from the file descriptor in C
+            h = hashlib.file_digest(f, "sha256")
+            length = f.tell()
+        else:
+            h = hashlib.sha256()
+            length = 0
+            while block := f.read(blocksize):
+                length += len(block)
+                h.update(block)
     digest = "sha256=" + urlsafe_b64encode(h.digest()).decode("latin1").rstrip("=")
     # unicode/str python2 issues
     return (digest, str(length))  # type: ignore
 
 
-def unzip_file(file, dest):
+def copy_file(src, dst):
+    """Copy `src` to `dst`, letting the kernel do the copy when copy_file_range is available."""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        if sys.platform == "linux":
+            import fcntl
+
+            try:
+                # Copy-on-write clone on filesystems supporting reflinks (btrfs, xfs), so that the
+                # following patchelf pass is the only actual write of the library contents
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                return
+            except OSError:
+                pass
+        try:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except (AttributeError, OSError):
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst, length=1 << 20)
+
+
+def unzip_file(file, dest, max_workers=8):
     """Decompress zip `file` into directory `dest`."""
     with zipfile.ZipFile(file, "r") as zip_ref:
-        zip_ref.extractall(dest)
+        members = zip_ref.infolist()
+        # Create the directory tree upfront so that workers don't race on os.makedirs
+        for member in members:
+            if member.is_dir():
+                zip_ref.extract(member, dest)
+            else:
+                parent = osp.dirname(member.filename)
+                if parent:
+                    os.makedirs(osp.join(dest, parent), exist_ok=True)
+
+    # ZipFile handles can't be shared across threads, give each worker its own
+    local = threading.local()
+    handles = []
+
+    def extract(member):
+        if not hasattr(local, "zip_ref"):
+            local.zip_ref = zipfile.ZipFile(file, "r")
+            handles.append(local.zip_ref)
+        local.zip_ref.extract(member, dest)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(extract, [member for member in members if not member.is_dir()]))
+    finally:
+        for handle in handles:
+            handle.close()
 
 
 def is_program_installed(basename):
@@ -121,7 +192,7 @@ def patch_new_path(library_path, new_dir):
     library = osp.basename(library_path)
     name, *rest = library.split(".")
     rest = ".".join(rest)
-    hash_id = hashlib.sha256(library_path.encode("utf-8")).hexdigest()[:8]
+    hash_id = hashlib.blake2b(library_path.encode("utf-8"), digest_size=4).hexdigest()
     new_name = ".".join([name, hash_id, rest])
     return osp.join(new_dir, new_name)
 
@@ -137,13 +208,27 @@ def find_dll_dependencies(dumpbin, binary):
     return dlls
 
 
-def relocate_elf_library(patchelf, output_dir, output_library, binary):
+def replace_needed_args(library, dependencies, new_names):
+    """Build the patchelf arguments that rename all `dependencies` of `library` in a single call."""
+    args = []
+    for dep in dependencies:
+        new_dep = osp.basename(new_names[dep])
+        print(f"{library}: {dep} -> {new_dep}")
+        args += ["--replace-needed", dep, new_dep]
+    return args
+
+
+def relocate_elf_library(patchelf, output_dir, output_library, binary, relocated=None):
     """
     Relocate an ELF shared library to be packaged on a wheel.
 
     Given a shared library, find the transitive closure of its dependencies,
     rename and copy them into the wheel while updating their respective rpaths.
+    ``relocated`` maps the dependencies already copied and patched by a previous
+    call on the same wheel to their new path; it is updated in place.
     """
+    if relocated is None:
+        relocated = {}
 
     print(f"Relocating {binary}")
     binary_path = osp.join(output_library, binary)
@@ -151,12 +236,12 @@ def relocate_elf_library(patchelf, output_dir, output_library, binary):
     ld_tree = lddtree(binary_path)
     tree_libs = ld_tree["libs"]
 
-    binary_queue = [(n, binary) for n in ld_tree["needed"]]
+    binary_queue = deque((n, binary) for n in ld_tree["needed"])
     binary_paths = {binary: binary_path}
     binary_dependencies = {}
 
-    while binary_queue != []:
-        library, parent = binary_queue.pop(0)
+    while binary_queue:
+        library, parent = binary_queue.popleft()
         library_info = tree_libs[library]
         print(library)
 
@@ -177,7 +262,7 @@ def relocate_elf_library(patchelf, output_dir, output_library, binary):
             continue
 
         binary_paths[library] = library_info["path"]
-        binary_queue += [(n, library) for n in library_info["needed"]]
+        binary_queue.extend((n, library) for n in library_info["needed"])
 
     print("Copying dependencies to wheel directory")
     new_libraries_path = osp.join(output_dir, "torchvision.libs")
@@ -186,62 +271,64 @@ def relocate_elf_library(patchelf, output_dir, output_library, binary):
     new_names = {binary: binary_path}
 
     for library in binary_paths:
-        if library != binary:
+        if library in relocated:
+            print(f"{library} already relocated")
+            new_names[library] = relocated[library]
+        elif library != binary:
             library_path = binary_paths[library]
             new_library_path = patch_new_path(library_path, new_libraries_path)
             print(f"{library} -> {new_library_path}")
-            shutil.copyfile(library_path, new_library_path)
+            copy_file(library_path, new_library_path)
             new_names[library] = new_library_path
 
     print("Updating dependency names by new files")
     for library in binary_paths:
-        if library != binary:
+        if library != binary and library not in relocated:
             if library not in binary_dependencies:
                 continue
             library_dependencies = binary_dependencies[library]
             new_library_name = new_names[library]
-            for dep in library_dependencies:
-                new_dep = osp.basename(new_names[dep])
-                print(f"{library}: {dep} -> {new_dep}")
-                subprocess.check_output(
-                    [patchelf, "--replace-needed", dep, new_dep, new_library_name], cwd=new_libraries_path
-                )
-
-            print("Updating library rpath")
-            subprocess.check_output([patchelf, "--set-rpath", "$ORIGIN", new_library_name], cwd=new_libraries_path)
+            print(f"Updating {library} dependencies and rpath")
+            args = replace_needed_args(library, library_dependencies, new_names)
+            subprocess.check_call(
+                [patchelf, "--set-rpath", "$ORIGIN", *args, new_library_name],
+                cwd=new_libraries_path,
+                stdout=subprocess.DEVNULL,
+            )
 
-            subprocess.check_output([patchelf, "--print-rpath", new_library_name], cwd=new_libraries_path)
+    relocated.update((library, new_names[library]) for library in binary_paths if library != binary)
 
-    print("Update library dependencies")
+    print("Update library dependencies and rpath")
     library_dependencies = binary_dependencies[binary]
-    for dep in library_dependencies:
-        new_dep = osp.basename(new_names[dep])
-        print(f"{binary}: {dep} -> {new_dep}")
-        subprocess.check_output([patchelf, "--replace-needed", dep, new_dep, binary], cwd=output_library)
-
-    print("Update library rpath")
-    subprocess.check_output(
-        [patchelf, "--set-rpath", "$ORIGIN:$ORIGIN/../torchvision.libs", binary_path], cwd=output_library
+    args = replace_needed_args(binary, library_dependencies, new_names)
+    subprocess.check_call(
+        [patchelf, "--set-rpath", "$ORIGIN:$ORIGIN/../torchvision.libs", *args, binary],
+        cwd=output_library,
+        stdout=subprocess.DEVNULL,
     )
 
 
-def relocate_dll_library(dumpbin, output_dir, output_library, binary):
+def relocate_dll_library(dumpbin, output_dir, output_library, binary, relocated=None):
     """
     Relocate a DLL/PE shared library to be packaged on a wheel.
 
     Given a shared library, find the transitive closure of its dependencies,
     rename and copy them into the wheel.
+    ``relocated`` maps the dependencies already copied by a previous call on
+    the same wheel to their new path; it is updated in place.
     """
+    if relocated is None:
+        relocated = {}
     print(f"Relocating {binary}")
     binary_path = osp.join(output_library, binary)
 
     library_dlls = find_dll_dependencies(dumpbin, binary_path)
-    binary_queue = [(dll, binary) for dll in library_dlls]
+    binary_queue = deque((dll, binary) for dll in library_dlls)
     binary_paths = {binary: binary_path}
     binary_dependencies = {}
 
-    while binary_queue != []:
-        library, parent = binary_queue.pop(0)
+    while binary_queue:
+        library, parent = binary_queue.popleft()
         if library in WINDOWS_ALLOWLIST or library.startswith("api-ms-win"):
             print(f"Omitting {library}")
             continue
@@ -264,40 +351,61 @@ def relocate_dll_library(dumpbin, output_dir, output_library, binary):
 
         binary_paths[library] = library_path
         downstream_dlls = find_dll_dependencies(dumpbin, library_path)
-        binary_queue += [(n, library) for n in downstream_dlls]
+        binary_queue.extend((n, library) for n in downstream_dlls)
 
     print("Copying dependencies to wheel directory")
     package_dir = osp.join(output_dir, "torchvision")
     for library in binary_paths:
-        if library != binary:
+        if library in relocated:
+            print(f"{library} already relocated")
+        elif library != binary:
             library_path = binary_paths[library]
             new_library_path = osp.join(package_dir, library)
             print(f"{library} -> {new_library_path}")
             shutil.copyfile(library_path, new_library_path)
+            relocated[library] = new_library_path
+
+
+def scan_files(path):
+    """Recursively yield the paths of all files under `path`."""
+    # Unlike os.walk, DirEntry.is_dir() reuses the file type returned when listing the directory
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from scan_files(entry.path)
+            else:
+                yield entry.path
 
 
-def compress_wheel(output_dir, wheel, wheel_dir, wheel_name):
+def compress_wheel(output_dir, wheel):
     """Create RECORD file and compress wheel distribution."""
     print("Update RECORD file in wheel")
     dist_info = glob.glob(osp.join(output_dir, "*.dist-info"))[0]
     record_file = osp.join(dist_info, "RECORD")
 
+    # Walk the tree once, the same listing is used for the RECORD file and the archive
+    files = [(full_file, osp.relpath(full_file, output_dir)) for full_file in scan_files(output_dir)]
+
+    # hashlib releases the GIL while hashing, so threads are enough to spread the work
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        hashes = list(executor.map(rehash, [full_file for full_file, _ in files if full_file != record_file]))
+    hashes = iter(hashes)
+
+    lines = []
+    for full_file, rel_file in files:
+        if full_file == record_file:
+            lines.append(f"{rel_file},,\n")
+        else:
+            digest, size = next(hashes)
+            lines.append(f"{rel_file},{digest},{size}\n")
     with open(record_file, "w") as f:
-        for root, _, files in os.walk(output_dir):
-            for this_file in files:
-                full_file = osp.join(root, this_file)
-                rel_file = osp.relpath(full_file, output_dir)
-                if full_file == record_file:
-                    f.write(f"{rel_file},,\n")
-                else:
-                    digest, size = rehash(full_file)
-                    f.write(f"{rel_file},{digest},{size}\n")
+        f.write("".join(lines))
 
     print("Compressing wheel")
-    base_wheel_name = osp.join(wheel_dir, wheel_name)
-    shutil.make_archive(base_wheel_name, "zip", output_dir)
-    os.remove(wheel)
-    shutil.move(f"{base_wheel_name}.zip", wheel)
+    with zipfile.ZipFile(wheel, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        for full_file, rel_file in files:
+            compress_type = zipfile.ZIP_STORED if full_file.endswith(STORED_EXTENSIONS) else zipfile.ZIP_DEFLATED
+            zf.write(full_file, rel_file, compress_type=compress_type)
     shutil.rmtree(output_dir)
 
 
@@ -323,18 +431,17 @@ def patch_linux():
 
         print("Unzipping wheel...")
         wheel_file = osp.basename(wheel)
-        wheel_dir = osp.dirname(wheel)
         print(f"{wheel_file}")
-        wheel_name, _ = osp.splitext(wheel_file)
         unzip_file(wheel, output_dir)
 
         print("Finding ELF dependencies...")
         output_library = osp.join(output_dir, "torchvision")
+        relocated = {}
         for binary in torchvision_binaries:
             if osp.exists(osp.join(output_library, binary)):
-                relocate_elf_library(patchelf, output_dir, output_library, binary)
+                relocate_elf_library(patchelf, output_dir, output_library, binary, relocated)
 
-        compress_wheel(output_dir, wheel, wheel_dir, wheel_name)
+        compress_wheel(output_dir, wheel)
 
 
 def patch_win():
@@ -359,18 +466,17 @@ def patch_win():
 
         print("Unzipping wheel...")
         wheel_file = osp.basename(wheel)
-        wheel_dir = osp.dirname(wheel)
         print(f"{wheel_file}")
-        wheel_name, _ = osp.splitext(wheel_file)
         unzip_file(wheel, output_dir)
 
         print("Finding DLL/PE dependencies...")
         output_library = osp.join(output_dir, "torchvision")
+        relocated = {}
         for binary in torchvision_binaries:
             if osp.exists(osp.join(output_library, binary)):
-                relocate_dll_library(dumpbin, output_dir, output_library, binary)
+                relocate_dll_library(dumpbin, output_dir, output_library, binary, relocated)
 
-        compress_wheel(output_dir, wheel, wheel_dir, wheel_name)
+        compress_wheel(output_dir, wheel)
 
 
 if __name__ == "__main__":
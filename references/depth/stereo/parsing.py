@@ -56,6 +56,7 @@ def make_train_transform(args: argparse.Namespace) -> torch.nn.Module:
         std=args.norm_std,
         horizontal_flip_prob=args.flip_prob,
         gpu_transforms=args.gpu_transforms,
+        compile_transforms=args.compile_transforms,
         max_disparity=args.max_disparity,
         spatial_shift_prob=args.spatial_shift_prob,
         spatial_shift_max_angle=args.spatial_shift_max_angle,
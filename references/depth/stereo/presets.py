@@ -60,6 +60,7 @@ class StereoMatchingTrainPreset(torch.nn.Module):
         std: float = 0.5,
         # processing device
         gpu_transforms: bool = False,
+        compile_transforms: bool = False,
         # masking
         max_disparity: Optional[int] = 256,
         # SpatialShift params
@@ -91,14 +92,15 @@ class StereoMatchingTrainPreset(torch.nn.Module):
         super().__init__()
         transforms = [T.ToTensor()]
 
+        if gpu_transforms:
+            # move the uint8 pair to the GPU right away so that every augmentation runs on device
+            transforms.append(T.ToGPU())
+
         # when fixing size across multiple datasets, we ensure
         # that the same size is used for all datasets when cropping
         if resize_size is not None:
             transforms.append(T.Resize(resize_size, interpolation_type=resize_interpolation_type))
 
-        if gpu_transforms:
-            transforms.append(T.ToGPU())
-
         # color handling
         color_transforms = [
             T.AsymmetricColorJitter(
@@ -129,8 +131,9 @@ class StereoMatchingTrainPreset(torch.nn.Module):
                     interpolation_type=scale_interpolation_type,
                 ),
                 T.RandomHorizontalFlip(horizontal_flip_prob),
-                # occlusion after flip, otherwise we're occluding the reference image
-                T.RandomOcclusion(p=occlusion_prob, occlusion_px_range=occlusion_px_range),
+                # occlusion after flip, otherwise we're occluding the reference image.
+                # The images are owned by the pipeline at this point, so they can be occluded in place
+                T.RandomOcclusion(p=occlusion_prob, occlusion_px_range=occlusion_px_range, inplace=True),
                 T.RandomErase(p=erase_prob, erase_px_range=erase_px_range, max_erase=erase_num_repeats),
                 T.Normalize(mean=mean, std=std),
                 T.MakeValidDisparityMask(max_disparity),
@@ -138,7 +141,7 @@ class StereoMatchingTrainPreset(torch.nn.Module):
             ]
         )
 
-        self.transforms = T.Compose(transforms)
+        self.transforms = T.Compose(transforms, compile_transforms=compile_transforms)
 
     def forward(self, images, disparties, mask):
         return self.transforms(images, disparties, mask)
@@ -657,6 +657,9 @@ def get_args_parser(add_help=True):
 
     # transforms parameters
     parser.add_argument("--gpu-transforms", action="store_true", help="use GPU transforms")
+    parser.add_argument(
+        "--compile-transforms", action="store_true", help="use torch.compile on the pure tensor train transforms"
+    )
     parser.add_argument(
         "--eval-size", type=int, nargs="+", default=[384, 512], help="size of the images for evaluation"
     )
@@ -15,7 +15,17 @@ T_COLOR_AUG_PARAM = Union[float, Tuple[float, float]]
 
 
 def rand_float_range(size: Sequence[int], low: float, high: float) -> Tensor:
-    return (low - high) * torch.rand(size) + high
+    return low + (high - low) * torch.rand(size)
+
+
+def _masked_fill(img: Tensor, mask: Tensor, value: Union[Tensor, float], inplace: bool = False) -> Tensor:
+    # Same as F.erase but for an arbitrary (H, W) boolean mask instead of a single rectangle
+    value = torch.as_tensor(value, dtype=img.dtype, device=img.device)
+    if value.dim() > 0:
+        # per-channel values can't go through masked_fill
+        out = torch.where(mask, value, img)
+        return img.copy_(out) if inplace else out
+    return img.masked_fill_(mask, value) if inplace else img.masked_fill(mask, value)
 
 
 class InterpolationStrategy:
@@ -89,6 +99,18 @@ class MakeValidDisparityMask(torch.nn.Module):
         disparities: Tuple[T_FLOW, T_FLOW],
         masks: Tuple[T_MASK, T_MASK],
     ) -> Tuple[T_STEREO_TENSOR, Tuple[T_FLOW, T_FLOW], Tuple[T_MASK, T_MASK]]:
+        if all(disparity is not None for disparity in disparities) and disparities[0].shape == disparities[1].shape:
+            # threshold both disparity maps at once
+            stacked = torch.stack(disparities)
+            valid = stacked > 0
+            if self.max_disparity is not None:
+                valid.logical_and_(stacked < self.max_disparity)
+            valid_masks = tuple(
+                dsp_mask if mask is None else torch.logical_and(mask, dsp_mask)
+                for mask, dsp_mask in zip(masks, valid.squeeze(1).unbind(0))
+            )
+            return images, disparities, valid_masks
+
         valid_masks = tuple(
             torch.ones(images[idx].shape[-2:], dtype=torch.bool, device=images[idx].device) if mask is None else mask
             for idx, mask in enumerate(masks)
@@ -118,9 +140,10 @@ class ToGPU(torch.nn.Module):
         disparities: Tuple[T_FLOW, T_FLOW],
         masks: Tuple[T_MASK, T_MASK],
     ) -> Tuple[T_STEREO_TENSOR, Tuple[T_FLOW, T_FLOW], Tuple[T_MASK, T_MASK]]:
-        dev_images = tuple(image.cuda() for image in images)
-        dev_disparities = tuple(map(lambda x: x.cuda() if x is not None else None, disparities))
-        dev_masks = tuple(map(lambda x: x.cuda() if x is not None else None, masks))
+        # the images are still uint8 at this point, which keeps the host to device copy small
+        dev_images = tuple(image.cuda(non_blocking=True) for image in images)
+        dev_disparities = tuple(map(lambda x: x.cuda(non_blocking=True) if x is not None else None, disparities))
+        dev_masks = tuple(map(lambda x: x.cuda(non_blocking=True) if x is not None else None, masks))
         return dev_images, dev_disparities, dev_masks
 
 
@@ -135,11 +158,14 @@ class ConvertImageDtype(torch.nn.Module):
         disparities: Tuple[T_FLOW, T_FLOW],
         masks: Tuple[T_MASK, T_MASK],
     ) -> Tuple[T_STEREO_TENSOR, Tuple[T_FLOW, T_FLOW], Tuple[T_MASK, T_MASK]]:
-        img_left = F.convert_image_dtype(images[0], dtype=self.dtype)
-        img_right = F.convert_image_dtype(images[1], dtype=self.dtype)
-
-        img_left = img_left.contiguous()
-        img_right = img_right.contiguous()
+        batch = torch.stack(images)
+        if batch.dtype == torch.uint8 and self.dtype.is_floating_point:
+            # common uint8 -> float case, same result as F.convert_image_dtype but the
+            # division happens in place on the freshly cast batch
+            batch = batch.to(self.dtype).div_(255)
+        else:
+            batch = F.convert_image_dtype(batch, dtype=self.dtype)
+        img_left, img_right = batch.unbind(0)
 
         return (img_left, img_right), disparities, masks
 
@@ -149,6 +175,9 @@ class Normalize(torch.nn.Module):
         super().__init__()
         self.mean = mean
         self.std = std
+        # kept as tensors so that they aren't re-created and copied to the device on every call
+        self.register_buffer("mean_t", torch.as_tensor(mean, dtype=torch.float32).view(-1, 1, 1), persistent=False)
+        self.register_buffer("std_t", torch.as_tensor(std, dtype=torch.float32).view(-1, 1, 1), persistent=False)
 
     def forward(
         self,
@@ -157,16 +186,26 @@ class Normalize(torch.nn.Module):
         masks: Tuple[T_MASK, T_MASK],
     ) -> Tuple[T_STEREO_TENSOR, Tuple[T_FLOW, T_FLOW], Tuple[T_MASK, T_MASK]]:
 
-        img_left = F.normalize(images[0], mean=self.mean, std=self.std)
-        img_right = F.normalize(images[1], mean=self.mean, std=self.std)
-
-        img_left = img_left.contiguous()
-        img_right = img_right.contiguous()
+        batch = torch.stack(images)
+        if not batch.is_floating_point():
+            raise TypeError(f"Input tensor should be a float tensor. Got {batch.dtype}.")
+        if self.mean_t.device != batch.device or self.mean_t.dtype != batch.dtype:
+            # the transforms aren't registered as submodules of Compose, so move the buffers on first use
+            self.mean_t = self.mean_t.to(batch.device, batch.dtype)
+            self.std_t = self.std_t.to(batch.device, batch.dtype)
+        # normalize both views at once, in place since the stacked batch is a fresh tensor.
+        # Slices along the batch dim of the stacked tensor are already contiguous
+        batch.sub_(self.mean_t).div_(self.std_t)
+        img_left, img_right = batch.unbind(0)
 
         return (img_left, img_right), disparities, masks
 
 
 class ToTensor(torch.nn.Module):
+    # PIL modes for which np.asarray gives the same values as F.pil_to_tensor. Others, e.g. "1", need its special
+    # handling and are converted view by view.
+    _STACKABLE_MODES = ("L", "RGB", "F")
+
     def forward(
         self,
         images: Tuple[PIL.Image.Image, PIL.Image.Image],
@@ -178,14 +217,21 @@ class ToTensor(torch.nn.Module):
         if images[1] is None:
             raise ValueError("img_right is None")
 
-        img_left = F.pil_to_tensor(images[0])
-        img_right = F.pil_to_tensor(images[1])
-        disparity_tensors = ()
-        mask_tensors = ()
+        if (
+            images[0].mode in self._STACKABLE_MODES
+            and images[0].mode == images[1].mode
+            and images[0].size == images[1].size
+        ):
+            # a single copy of both views into one array, same layout as F.pil_to_tensor
+            width, height = images[0].size
+            batch = np.stack([np.asarray(images[0]), np.asarray(images[1])]).reshape(2, height, width, -1)
+            img_left, img_right = torch.from_numpy(batch).permute(0, 3, 1, 2).unbind(0)
+        else:
+            img_left = F.pil_to_tensor(images[0])
+            img_right = F.pil_to_tensor(images[1])
 
-        for idx in range(2):
-            disparity_tensors += (torch.from_numpy(disparities[idx]),) if disparities[idx] is not None else (None,)
-            mask_tensors += (torch.from_numpy(masks[idx]),) if masks[idx] is not None else (None,)
+        disparity_tensors = tuple(torch.from_numpy(d) if d is not None else None for d in disparities)
+        mask_tensors = tuple(torch.from_numpy(m) if m is not None else None for m in masks)
 
         return (img_left, img_right), disparity_tensors, mask_tensors
 
@@ -209,19 +255,73 @@ class AsymmetricColorJitter(T.ColorJitter):
         disparities: Tuple[T_FLOW, T_FLOW],
         masks: Tuple[T_MASK, T_MASK],
     ) -> Tuple[T_STEREO_TENSOR, Tuple[T_FLOW, T_FLOW], Tuple[T_MASK, T_MASK]]:
+        if not all(isinstance(image, Tensor) for image in images):
+            raise TypeError("AsymmetricColorJitter expects tensor images, make sure ToTensor is applied first.")
 
-        if torch.rand(1) < self.p:
+        batch = torch.stack(images)
+        if random.random() < self.p:
             # asymmetric: different transform for img1 and img2
-            img_left = super().forward(images[0])
-            img_right = super().forward(images[1])
+            batch = self._asymmetric_jitter(batch)
         else:
             # symmetric: same transform for img1 and img2
-            batch = torch.stack(images)
             batch = super().forward(batch)
-            img_left, img_right = batch[0], batch[1]
+        img_left, img_right = batch[0], batch[1]
 
         return (img_left, img_right), disparities, masks
 
+    @staticmethod
+    def get_params(
+        brightness: Optional[List[float]],
+        contrast: Optional[List[float]],
+        saturation: Optional[List[float]],
+        hue: Optional[List[float]],
+    ) -> Tuple[List[int], Optional[float], Optional[float], Optional[float], Optional[float]]:
+        # Same as T.ColorJitter.get_params, with Python scalars instead of one-element tensors
+        fn_idx = random.sample(range(4), 4)
+
+        b = None if brightness is None else random.uniform(brightness[0], brightness[1])
+        c = None if contrast is None else random.uniform(contrast[0], contrast[1])
+        s = None if saturation is None else random.uniform(saturation[0], saturation[1])
+        h = None if hue is None else random.uniform(hue[0], hue[1])
+
+        return fn_idx, b, c, s, h
+
+    def _asymmetric_jitter(self, batch: Tensor) -> Tensor:
+        # Samples independent factors for every image of the batch and applies them all at once
+        # by broadcasting them over the batch dimension. The order of the adjustments is shared.
+        params = [self.get_params(self.brightness, self.contrast, self.saturation, self.hue) for _ in batch]
+        fn_idx = params[0][0]
+        num_channels = batch.shape[-3]
+        for fn_id in fn_idx:
+            factors = [p[fn_id + 1] for p in params]
+            if factors[0] is None:
+                continue
+
+            if fn_id == 3:
+                # hue goes through a HSV round-trip that only accepts a scalar factor
+                batch = torch.stack([F.adjust_hue(img, factor) for img, factor in zip(batch, factors)])
+                continue
+
+            ratio = torch.tensor(factors, dtype=torch.float32, device=batch.device).view(-1, 1, 1, 1)
+            if fn_id == 0:
+                # brightness
+                other = torch.zeros((), dtype=batch.dtype, device=batch.device)
+            elif fn_id == 1:
+                # contrast
+                gray = F.rgb_to_grayscale(batch) if num_channels == 3 else batch
+                dtype = batch.dtype if batch.is_floating_point() else torch.float32
+                other = gray.to(dtype).mean(dim=(-3, -2, -1), keepdim=True)
+            else:
+                # saturation
+                if num_channels == 1:
+                    continue
+                other = F.rgb_to_grayscale(batch)
+
+            bound = 1.0 if batch.is_floating_point() else 255.0
+            batch = (ratio * batch + (1.0 - ratio) * other).clamp(0, bound).to(batch.dtype)
+
+        return batch
+
 
 class AsymetricGammaAdjust(torch.nn.Module):
     def __init__(self, p: float, gamma_range: Tuple[float, float], gain: float = 1) -> None:
@@ -237,17 +337,24 @@ class AsymetricGammaAdjust(torch.nn.Module):
         masks: Tuple[T_MASK, T_MASK],
     ) -> Tuple[T_STEREO_TENSOR, Tuple[T_FLOW, T_FLOW], Tuple[T_MASK, T_MASK]]:
 
-        gamma = rand_float_range((1,), low=self.gamma_range[0], high=self.gamma_range[1]).item()
-
-        if torch.rand(1) < self.p:
-            # asymmetric: different transform for img1 and img2
-            img_left = F.adjust_gamma(images[0], gamma, gain=self.gain)
-            img_right = F.adjust_gamma(images[1], gamma, gain=self.gain)
+        if not all(isinstance(image, Tensor) for image in images):
+            raise TypeError("AsymetricGammaAdjust expects tensor images, make sure ToTensor is applied first.")
+
+        batch = torch.stack(images)
+        if random.random() < self.p:
+            # asymmetric: different transform for img1 and img2, one gamma per image broadcast over the batch
+            gamma = torch.tensor(
+                [random.uniform(self.gamma_range[0], self.gamma_range[1]) for _ in images], device=batch.device
+            ).view(-1, 1, 1, 1)
+            # same as F.adjust_gamma, which only accepts a scalar gamma
+            result = batch if batch.is_floating_point() else F.convert_image_dtype(batch, torch.float32)
+            result = (self.gain * result**gamma).clamp(0, 1)
+            batch = F.convert_image_dtype(result, batch.dtype)
         else:
             # symmetric: same transform for img1 and img2
-            batch = torch.stack(images)
+            gamma = random.uniform(self.gamma_range[0], self.gamma_range[1])
             batch = F.adjust_gamma(batch, gamma, gain=self.gain)
-            img_left, img_right = batch[0], batch[1]
+        img_left, img_right = batch[0], batch[1]
 
         return (img_left, img_right), disparities, masks
 
@@ -286,34 +393,45 @@ class RandomErase(torch.nn.Module):
         masks: T_STEREO_TENSOR,
     ) -> Tuple[T_STEREO_TENSOR, Tuple[T_FLOW, T_FLOW], Tuple[T_MASK, T_MASK]]:
 
-        if torch.rand(1) < self.p:
+        if random.random() < self.p:
             return images, disparities, masks
 
         image_left, image_right = images
         mask_left, mask_right = masks
-        for _ in range(torch.randint(self.max_erase, size=(1,)).item()):
-            y, x, h, w, v = self._get_params(image_left)
-            image_right = F.erase(image_right, y, x, h, w, v, self.inplace)
-            image_left = F.erase(image_left, y, x, h, w, v, self.inplace)
-            # similarly to optical flow occlusion prediction, we consider
-            # any erasure pixels that are in both images to be occluded therefore
-            # we mark them as invalid
-            if mask_left is not None:
-                mask_left = F.erase(mask_left, y, x, h, w, False, self.inplace)
-            if mask_right is not None:
-                mask_right = F.erase(mask_right, y, x, h, w, False, self.inplace)
+        num_erase = random.randrange(self.max_erase)
+        if num_erase == 0:
+            return images, disparities, masks
+
+        # gather all the erased rectangles in a single mask so that every tensor is only written once
+        erase_mask = torch.zeros(image_left.shape[-2:], dtype=torch.bool, device=image_left.device)
+        for y, x, h, w in zip(*self._get_params(image_left, num_erase)):
+            erase_mask[y : y + h, x : x + w] = True
+
+        image_left = _masked_fill(image_left, erase_mask, self.value, self.inplace)
+        image_right = _masked_fill(image_right, erase_mask, self.value, self.inplace)
+        # similarly to optical flow occlusion prediction, we consider
+        # any erasure pixels that are in both images to be occluded therefore
+        # we mark them as invalid
+        if mask_left is not None:
+            mask_left = _masked_fill(mask_left, erase_mask, False, self.inplace)
+        if mask_right is not None:
+            mask_right = _masked_fill(mask_right, erase_mask, False, self.inplace)
 
         return (image_left, image_right), disparities, (mask_left, mask_right)
 
-    def _get_params(self, img: torch.Tensor) -> Tuple[int, int, int, int, float]:
+    def _get_params(self, img: torch.Tensor, num_erase: int) -> Tuple[List[int], List[int], List[int], List[int]]:
+        # draws the parameters of all the erasures, from the same python RNG as the other transforms of this module
         img_h, img_w = img.shape[-2:]
-        crop_h, crop_w = (
-            random.randint(self.min_px_erase, self.max_px_erase),
-            random.randint(self.min_px_erase, self.max_px_erase),
-        )
-        crop_x, crop_y = (random.randint(0, img_w - crop_w), random.randint(0, img_h - crop_h))
+        crop_h = [random.randint(self.min_px_erase, self.max_px_erase) for _ in range(num_erase)]
+        crop_w = [random.randint(self.min_px_erase, self.max_px_erase) for _ in range(num_erase)]
+        if max(crop_h) > img_h or max(crop_w) > img_w:
+            raise ValueError(
+                f"Erase size ({max(crop_h)}, {max(crop_w)}) should not be larger than the image size ({img_h}, {img_w})"
+            )
+        crop_y = [random.randint(0, img_h - h) for h in crop_h]
+        crop_x = [random.randint(0, img_w - w) for w in crop_w]
 
-        return crop_y, crop_x, crop_h, crop_w, self.value
+        return crop_y, crop_x, crop_h, crop_w
 
 
 class RandomOcclusion(torch.nn.Module):
@@ -345,11 +463,12 @@ class RandomOcclusion(torch.nn.Module):
 
         left_image, right_image = images
 
-        if torch.rand(1) < self.p:
+        if random.random() < self.p:
             return images, disparities, masks
 
         y, x, h, w, v = self._get_params(right_image)
-        right_image = F.erase(right_image, y, x, h, w, v, self.inplace)
+        if h * w > 0:
+            right_image = F.erase(right_image, y, x, h, w, v, self.inplace)
 
         return ((left_image, right_image), disparities, masks)
 
@@ -361,6 +480,10 @@ class RandomOcclusion(torch.nn.Module):
         )
 
         crop_x, crop_y = (random.randint(0, img_w - crop_w), random.randint(0, img_h - crop_h))
+        if crop_h * crop_w == 0:
+            # nothing gets occluded, don't average an empty patch
+            return (crop_y, crop_x, crop_h, crop_w, 0.0)
+        # per-channel (C, 1, 1) fill value, broadcast by F.erase
         occlusion_value = img[..., crop_y : crop_y + crop_h, crop_x : crop_x + crop_w].mean(dim=(-2, -1), keepdim=True)
 
         return (crop_y, crop_x, crop_h, crop_w, occlusion_value)
@@ -387,15 +510,14 @@ class RandomSpatialShift(torch.nn.Module):
         # in order to mimic slight calibration issues
         img_left, img_right = images
 
-        INTERP_MODE = self._interpolation_mode_strategy()
-
-        if torch.rand(1) < self.p:
+        if random.random() < self.p:
+            INTERP_MODE = self._interpolation_mode_strategy()
             # [0, 1] -> [-a, a]
-            shift = rand_float_range((1,), low=-self.max_px_shift, high=self.max_px_shift).item()
-            angle = rand_float_range((1,), low=-self.max_angle, high=self.max_angle).item()
+            shift = random.uniform(-self.max_px_shift, self.max_px_shift)
+            angle = random.uniform(-self.max_angle, self.max_angle)
             # sample center point for the rotation matrix
-            y = torch.randint(size=(1,), low=0, high=img_right.shape[-2]).item()
-            x = torch.randint(size=(1,), low=0, high=img_right.shape[-1]).item()
+            y = random.randrange(img_right.shape[-2])
+            x = random.randrange(img_right.shape[-1])
             # apply affine transformations
             img_right = F.affine(
                 img_right,
@@ -426,15 +548,26 @@ class RandomHorizontalFlip(torch.nn.Module):
         dsp_left, dsp_right = disparities
         mask_left, mask_right = masks
 
-        if dsp_right is not None and torch.rand(1) < self.p:
-            img_left, img_right = F.hflip(img_left), F.hflip(img_right)
-            dsp_left, dsp_right = F.hflip(dsp_left), F.hflip(dsp_right)
-            if mask_left is not None and mask_right is not None:
-                mask_left, mask_right = F.hflip(mask_left), F.hflip(mask_right)
-            return ((img_right, img_left), (dsp_right, dsp_left), (mask_right, mask_left))
+        if dsp_right is not None and random.random() < self.p:
+            # flipping swaps the left and right views
+            return (
+                self._hflip_swapped(img_left, img_right),
+                self._hflip_swapped(dsp_left, dsp_right),
+                self._hflip_swapped(mask_left, mask_right),
+            )
 
         return images, disparities, masks
 
+    @staticmethod
+    def _hflip_swapped(left: Optional[Tensor], right: Optional[Tensor]) -> Tuple[Optional[Tensor], Optional[Tensor]]:
+        if left is not None and right is not None:
+            # stacking in swapped order lets a single flip produce the output pair
+            return tuple(torch.stack([right, left]).flip(-1).unbind(0))
+        return (
+            F.hflip(right) if right is not None else None,
+            F.hflip(left) if left is not None else None,
+        )
+
 
 class Resize(torch.nn.Module):
     def __init__(self, resize_size: Tuple[int, ...], interpolation_type: str = "bilinear") -> None:
@@ -540,37 +673,47 @@ class RandomRescaleAndCrop(torch.nn.Module):
         # a rescaling of 2X the original size, whereas a scale of -1 will result in a rescaling
         # of 0.5X the original size.
         if self.scaling_type == "exponential":
-            scale = 2 ** torch.empty(1, dtype=torch.float32).uniform_(self.min_scale, self.max_scale).item()
+            scale = 2 ** random.uniform(self.min_scale, self.max_scale)
         # linear scaling will draw a random scale in (min_scale, max_scale)
         elif self.scaling_type == "linear":
-            scale = torch.empty(1, dtype=torch.float32).uniform_(self.min_scale, self.max_scale).item()
+            scale = random.uniform(self.min_scale, self.max_scale)
 
         scale = max(scale, min_scale)
 
         new_h, new_w = round(h * scale), round(w * scale)
 
-        if torch.rand(1).item() < self.rescale_prob:
-            # rescale the images
-            img_left = F.resize(img_left, size=(new_h, new_w), interpolation=INTERP_MODE)
-            img_right = F.resize(img_right, size=(new_h, new_w), interpolation=INTERP_MODE)
-
-            resized_masks, resized_disparities = (), ()
-
-            for disparity, mask in zip(disparities, masks):
-                if disparity is not None:
-                    if mask is None:
-                        resized_disparity = F.resize(disparity, size=(new_h, new_w), interpolation=INTERP_MODE)
-                        # rescale the disparity
-                        resized_disparity = (
-                            resized_disparity * torch.tensor([scale], device=resized_disparity.device)[:, None, None]
-                        )
-                        resized_mask = None
-                    else:
-                        resized_disparity, resized_mask = _resize_sparse_flow(
-                            disparity, mask, scale_x=scale, scale_y=scale
-                        )
-                resized_masks += (resized_mask,)
-                resized_disparities += (resized_disparity,)
+        if random.random() < self.rescale_prob:
+            # rescale both images with a single call
+            img_batch = F.resize(
+                torch.stack([img_left, img_right]), size=(new_h, new_w), interpolation=INTERP_MODE, antialias=True
+            )
+            img_left, img_right = img_batch.unbind(0)
+
+            if all(disparity is not None for disparity in disparities) and all(mask is None for mask in masks):
+                # dense disparities: resize the pair at once, and rescale the disparity values in place
+                dsp_batch = F.resize(
+                    torch.stack(disparities), size=(new_h, new_w), interpolation=INTERP_MODE, antialias=True
+                )
+                resized_disparities = tuple(dsp_batch.mul_(scale).unbind(0))
+                resized_masks = masks
+            else:
+                resized_masks, resized_disparities = (), ()
+
+                for disparity, mask in zip(disparities, masks):
+                    if disparity is not None:
+                        if mask is None:
+                            resized_disparity = F.resize(
+                                disparity, size=(new_h, new_w), interpolation=INTERP_MODE, antialias=True
+                            )
+                            # rescale the disparity
+                            resized_disparity = resized_disparity * scale
+                            resized_mask = None
+                        else:
+                            resized_disparity, resized_mask = _resize_sparse_flow(
+                                disparity, mask, scale_x=scale, scale_y=scale
+                            )
+                    resized_masks += (resized_mask,)
+                    resized_disparities += (resized_disparity,)
 
         else:
             resized_disparities = disparities
@@ -582,21 +725,22 @@ class RandomRescaleAndCrop(torch.nn.Module):
         # Note: For sparse datasets (Kitti), the original code uses a "margin"
         # See e.g. https://github.com/princeton-vl/RAFT/blob/master/core/utils/augmentor.py#L220:L220
         # We don't, not sure if it matters much
-        y0 = torch.randint(0, img_left.shape[1] - self.crop_size[0], size=(1,)).item()
-        x0 = torch.randint(0, img_right.shape[2] - self.crop_size[1], size=(1,)).item()
+        y0 = random.randrange(img_left.shape[1] - self.crop_size[0])
+        x0 = random.randrange(img_right.shape[2] - self.crop_size[1])
 
-        img_left = F.crop(img_left, y0, x0, self.crop_size[0], self.crop_size[1])
-        img_right = F.crop(img_right, y0, x0, self.crop_size[0], self.crop_size[1])
+        # the crop is always within bounds, so plain slicing gives the same views as F.crop without
+        # going through its per-call checks
+        rows = slice(y0, y0 + self.crop_size[0])
+        cols = slice(x0, x0 + self.crop_size[1])
+
+        img_left = img_left[..., rows, cols]
+        img_right = img_right[..., rows, cols]
         if dsp_left is not None:
-            dsp_left = F.crop(disparities[0], y0, x0, self.crop_size[0], self.crop_size[1])
+            dsp_left = disparities[0][..., rows, cols]
         if dsp_right is not None:
-            dsp_right = F.crop(disparities[1], y0, x0, self.crop_size[0], self.crop_size[1])
+            dsp_right = disparities[1][..., rows, cols]
 
-        cropped_masks = ()
-        for mask in masks:
-            if mask is not None:
-                mask = F.crop(mask, y0, x0, self.crop_size[0], self.crop_size[1])
-            cropped_masks += (mask,)
+        cropped_masks = tuple(mask[..., rows, cols] if mask is not None else None for mask in masks)
 
         return ((img_left, img_right), (dsp_left, dsp_right), cropped_masks)
 
@@ -612,15 +756,14 @@ def _resize_sparse_flow(
 
     h_new = int(round(h * scale_y))
     w_new = int(round(w * scale_x))
-    flow_new = torch.zeros(size=[1, h_new, w_new], dtype=flow.dtype)
-    valid_new = torch.zeros(size=[h_new, w_new], dtype=valid_flow_mask.dtype)
-
-    jj, ii = torch.meshgrid(torch.arange(w), torch.arange(h), indexing="xy")
+    flow_new = torch.zeros(size=[1, h_new, w_new], dtype=flow.dtype, device=flow.device)
+    valid_new = torch.zeros(size=[h_new, w_new], dtype=valid_flow_mask.dtype, device=valid_flow_mask.device)
 
-    ii_valid, jj_valid = ii[valid_flow_mask], jj[valid_flow_mask]
+    # only materialize the coordinates of the valid pixels
+    ii_valid, jj_valid = torch.nonzero(valid_flow_mask, as_tuple=True)
 
-    ii_valid_new = torch.round(ii_valid.to(float) * scale_y).to(torch.long)
-    jj_valid_new = torch.round(jj_valid.to(float) * scale_x).to(torch.long)
+    ii_valid_new = ii_valid.to(float).mul_(scale_y).round_().to(torch.long)
+    jj_valid_new = jj_valid.to(float).mul_(scale_x).round_().to(torch.long)
 
     within_bounds_mask = (0 <= ii_valid_new) & (ii_valid_new < h_new) & (0 <= jj_valid_new) & (jj_valid_new < w_new)
 
@@ -629,18 +772,25 @@ def _resize_sparse_flow(
     ii_valid_new = ii_valid_new[within_bounds_mask]
     jj_valid_new = jj_valid_new[within_bounds_mask]
 
-    valid_flow_new = flow[:, ii_valid, jj_valid]
-    valid_flow_new *= scale_x
-
-    flow_new[:, ii_valid_new, jj_valid_new] = valid_flow_new
-    valid_new[ii_valid_new, jj_valid_new] = valid_flow_mask[ii_valid, jj_valid]
+    # the gather already returns a copy, so the disparities can be rescaled in place
+    flow_new[:, ii_valid_new, jj_valid_new] = flow[:, ii_valid, jj_valid].mul_(scale_x)
+    valid_new.index_put_((ii_valid_new, jj_valid_new), valid_flow_mask[ii_valid, jj_valid])
 
     return flow_new, valid_new.bool()
 
 
 class Compose(torch.nn.Module):
-    def __init__(self, transforms: List[Callable]):
+    # Transforms made of tensor ops only, without data-dependent python control flow. These can be
+    # compiled without graph breaks, the random transforms are kept in eager mode.
+    _compilable_transforms = (ConvertImageDtype, Normalize, MakeValidDisparityMask)
+
+    def __init__(self, transforms: List[Callable], compile_transforms: bool = False):
         super().__init__()
+        if compile_transforms:
+            # dynamic=True as the random rescaling changes the input shapes from one sample to the next
+            transforms = [
+                torch.compile(t, dynamic=True) if isinstance(t, self._compilable_transforms) else t for t in transforms
+            ]
         self.transforms = transforms
 
     @torch.inference_mode()
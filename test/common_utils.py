@@ -412,8 +412,9 @@ def make_bounding_boxes(
 ):
     def sample_position(values, max_value):
         # We cannot use torch.randint directly here, because it only allows integer scalars as values for low and high.
-        # However, if we have batch_dims, we need tensors as limits.
-        return torch.stack([torch.randint(max_value - v, ()) for v in values.tolist()])
+        # However, if we have batch_dims, we need tensors as limits. Thus, we scale uniform samples by the limits instead,
+        # which draws the positions of all boxes at once rather than one at a time.
+        return (torch.rand(values.shape, dtype=torch.float64) * (max_value - values)).long()
 
     if isinstance(format, str):
         format = tv_tensors.BoundingBoxFormat[format]
@@ -2529,6 +2529,30 @@ class FER2013TestCase(datasets_utils.ImageDatasetTestCase):
                 with self.create_dataset(config=config) as (dataset, _):
                     assert all(s[1] is not None for s in dataset)
 
+    def test_return_tensor(self):
+        with self.create_dataset(return_tensor=True) as (dataset, _):
+            image, _ = dataset[0]
+            assert isinstance(image, torch.Tensor)
+            assert image.shape == (1, 48, 48)
+            assert image.dtype == torch.uint8
+
+    def test_cache_invalidated_on_csv_change(self):
+        with self.create_dataset(split="train", return_tensor=True) as (dataset, _):
+            data_file = pathlib.Path(dataset.root) / "fer2013" / "train.csv"
+            with open(data_file, newline="") as file:
+                header, *rows = list(csv.reader(file))
+            with open(data_file, "w", newline="") as file:
+                csv.writer(file).writerows([header, *reversed(rows)])
+            stat = data_file.stat()
+            os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            with self._maybe_apply_patches(self._patch_checks()):
+                new_dataset = datasets.FER2013(dataset.root, split="train", return_tensor=True)
+
+            assert len(new_dataset) == len(dataset)
+            for idx in range(len(dataset)):
+                torch.testing.assert_close(new_dataset[idx][0], dataset[len(dataset) - 1 - idx][0])
+
 
 class GTSRBTestCase(datasets_utils.ImageDatasetTestCase):
     DATASET_CLASS = datasets.GTSRB
@@ -1,3 +1,5 @@
+import os
+
 import pytest
 import torch
 from common_utils import assert_equal, get_list_of_videos
@@ -55,6 +57,20 @@ class TestVideo:
             assert video_idx == v_idx
             assert clip_idx == c_idx
 
+    @pytest.mark.skipif(not io.video._av_available(), reason="this test requires av")
+    def test_video_clips_cache(self, tmpdir, mocker):
+        video_list = get_list_of_videos(tmpdir, num_videos=3)
+        cache_path = os.path.join(tmpdir, "cache.pt")
+        video_clips = VideoClips(video_list, 5, 5, cache_path=cache_path)
+        assert os.path.exists(cache_path)
+
+        read_frame_pts = mocker.spy(VideoClips, "_read_frame_pts")
+        cached_video_clips = VideoClips(video_list, 5, 5, cache_path=cache_path)
+        read_frame_pts.assert_not_called()
+        assert cached_video_clips.num_clips() == video_clips.num_clips()
+        for pts, cached_pts in zip(video_clips.video_pts, cached_video_clips.video_pts):
+            assert_equal(pts, cached_pts)
+
     @pytest.mark.skipif(not io.video._av_available(), reason="this test requires av")
     def test_video_clips_custom_fps(self, tmpdir):
         video_list = get_list_of_videos(tmpdir, num_videos=3, sizes=[12, 12, 12], fps=[3, 4, 6])
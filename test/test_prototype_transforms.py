@@ -159,7 +159,7 @@ class TestSimpleCopyPaste:
 
 
 class TestFixedSizeCrop:
-    def test__get_params(self, mocker):
+    def test__get_params(self):
         crop_size = (7, 7)
         batch_shape = (10,)
         canvas_size = (11, 5)
@@ -267,6 +267,18 @@ class TestLabelToOneHot:
         assert ohe_labels.categories == labels.categories == categories
 
 
+@pytest.fixture(scope="module")
+def sample():
+    # The dimension transforms never modify their inputs, so the sample can be shared by all parametrizations
+    return dict(
+        image=make_image(),
+        bounding_boxes=make_bounding_boxes(format=BoundingBoxFormat.XYXY),
+        video=make_video(),
+        str="str",
+        int=0,
+    )
+
+
 class TestPermuteDimensions:
     @pytest.mark.parametrize(
         ("dims", "inverse_dims"),
@@ -281,15 +293,7 @@ class TestPermuteDimensions:
             ),
         ],
     )
-    def test_call(self, dims, inverse_dims):
-        sample = dict(
-            image=make_image(),
-            bounding_boxes=make_bounding_boxes(format=BoundingBoxFormat.XYXY),
-            video=make_video(),
-            str="str",
-            int=0,
-        )
-
+    def test_call(self, dims, inverse_dims, sample):
         transform = transforms.PermuteDimensions(dims)
         transformed_sample = transform(sample)
 
@@ -325,15 +329,7 @@ class TestTransposeDimensions:
             {Image: (1, 2), Video: None},
         ],
     )
-    def test_call(self, dims):
-        sample = dict(
-            image=make_image(),
-            bounding_boxes=make_bounding_boxes(format=BoundingBoxFormat.XYXY),
-            video=make_video(),
-            str="str",
-            int=0,
-        )
-
+    def test_call(self, dims, sample):
         transform = transforms.TransposeDimensions(dims)
         transformed_sample = transform(sample)
 
@@ -420,10 +416,12 @@ def test_fixed_sized_crop_against_detection_reference():
 
     for dp in make_tv_tensors():
         # We should use prototype transform first as reference transform performs inplace target update
-        torch.manual_seed(12)
+        # Both transforms only draw from the CPU generator, so restoring its state is enough to replay the same
+        # random crop without reseeding every device through torch.manual_seed.
+        rng_state = torch.get_rng_state()
         output = t(dp)
 
-        torch.manual_seed(12)
+        torch.set_rng_state(rng_state)
         expected_output = t_ref(*dp)
 
         assert_equal(expected_output, output)
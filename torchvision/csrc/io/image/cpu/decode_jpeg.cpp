@@ -3,6 +3,8 @@
 #include "common_jpeg.h"
 #include "exif.h"
 
+#include <ATen/Parallel.h>
+
 namespace vision {
 namespace image {
 
@@ -248,6 +250,30 @@ torch::Tensor decode_jpeg(
 }
 #endif // #if !JPEG_FOUND
 
+std::vector<torch::Tensor> decode_jpegs(
+    const std::vector<torch::Tensor>& encoded_images,
+    ImageReadMode mode,
+    bool apply_exif_orientation) {
+  C10_LOG_API_USAGE_ONCE(
+      "torchvision.csrc.io.image.cpu.decode_jpeg.decode_jpegs");
+
+  // The images are independent of each other and libjpeg keeps all of its
+  // state in the per-image decompression struct, so the batch is decoded
+  // concurrently on the intra-op thread pool.
+  std::vector<torch::Tensor> decoded_images(encoded_images.size());
+  at::parallel_for(
+      0,
+      static_cast<int64_t>(encoded_images.size()),
+      /*grain_size=*/1,
+      [&](int64_t begin, int64_t end) {
+        for (int64_t i = begin; i < end; ++i) {
+          decoded_images[i] =
+              decode_jpeg(encoded_images[i], mode, apply_exif_orientation);
+        }
+      });
+  return decoded_images;
+}
+
 int64_t _jpeg_version() {
 #if JPEG_FOUND
   return JPEG_LIB_VERSION;
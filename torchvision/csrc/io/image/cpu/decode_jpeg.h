@@ -11,6 +11,11 @@ C10_EXPORT torch::Tensor decode_jpeg(
     ImageReadMode mode = IMAGE_READ_MODE_UNCHANGED,
     bool apply_exif_orientation = false);
 
+C10_EXPORT std::vector<torch::Tensor> decode_jpegs(
+    const std::vector<torch::Tensor>& encoded_images,
+    ImageReadMode mode = IMAGE_READ_MODE_UNCHANGED,
+    bool apply_exif_orientation = false);
+
 C10_EXPORT int64_t _jpeg_version();
 C10_EXPORT bool _is_compiled_against_turbo();
 
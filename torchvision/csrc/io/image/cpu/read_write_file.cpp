@@ -5,6 +5,11 @@
 #ifdef _WIN32
 #define WIN32_LEAN_AND_MEAN
 #include <Windows.h>
+#else
+#include <fcntl.h>
+#include <unistd.h>
+#include <cerrno>
+#include <cstring>
 #endif
 
 namespace vision {
@@ -42,10 +47,6 @@ torch::Tensor read_file(const std::string& filename) {
   struct __stat64 stat_buf;
   auto fileW = utf8_decode(filename);
   int rc = _wstat64(fileW.c_str(), &stat_buf);
-#else
-  struct stat stat_buf;
-  int rc = stat(filename.c_str(), &stat_buf);
-#endif
   // errno is a variable defined in errno.h
   TORCH_CHECK(
       rc == 0, "[Errno ", errno, "] ", strerror(errno), ": '", filename, "'");
@@ -54,7 +55,6 @@ torch::Tensor read_file(const std::string& filename) {
 
   TORCH_CHECK(size > 0, "Expected a non empty file");
 
-#ifdef _WIN32
   // TODO: Once torch::from_file handles UTF-8 paths correctly, we should move
   // back to use the following implementation since it uses file mapping.
   //   auto data =
@@ -70,8 +70,48 @@ torch::Tensor read_file(const std::string& filename) {
   fread(dataBytes, sizeof(uint8_t), size, infile);
   fclose(infile);
 #else
-  auto data =
-      torch::from_file(filename, /*shared=*/false, /*size=*/size, torch::kU8);
+  // The file is opened once and its size is taken from the open descriptor
+  // rather than resolving the path again. For the typically small image files,
+  // reading the content into a regular tensor is also cheaper than setting up
+  // and tearing down a file mapping.
+  int fd = open(filename.c_str(), O_RDONLY | O_CLOEXEC);
+  // errno is a variable defined in errno.h
+  TORCH_CHECK(
+      fd >= 0, "[Errno ", errno, "] ", strerror(errno), ": '", filename, "'");
+
+  struct stat stat_buf;
+  if (fstat(fd, &stat_buf) != 0) {
+    int err = errno;
+    close(fd);
+    TORCH_CHECK(
+        false, "[Errno ", err, "] ", strerror(err), ": '", filename, "'");
+  }
+
+  int64_t size = stat_buf.st_size;
+
+  if (size <= 0) {
+    close(fd);
+    TORCH_CHECK(false, "Expected a non empty file");
+  }
+
+  auto data = torch::empty({size}, torch::kU8);
+  auto dataBytes = data.data_ptr<uint8_t>();
+
+  int64_t offset = 0;
+  while (offset < size) {
+    ssize_t num_read = read(fd, dataBytes + offset, size - offset);
+    if (num_read < 0 && errno == EINTR) {
+      continue;
+    }
+    if (num_read <= 0) {
+      int err = num_read < 0 ? errno : EIO;
+      close(fd);
+      TORCH_CHECK(
+          false, "[Errno ", err, "] ", strerror(err), ": '", filename, "'");
+    }
+    offset += num_read;
+  }
+  close(fd);
 #endif
 
   return data;
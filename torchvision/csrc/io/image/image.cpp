@@ -21,6 +21,8 @@ static auto registry =
         .op("image::encode_png", &encode_png)
         .op("image::decode_jpeg(Tensor data, int mode, bool apply_exif_orientation=False) -> Tensor",
             &decode_jpeg)
+        .op("image::decode_jpegs(Tensor[] data, int mode, bool apply_exif_orientation=False) -> Tensor[]",
+            &decode_jpegs)
         .op("image::decode_webp(Tensor encoded_data, int mode) -> Tensor",
             &decode_webp)
         .op("image::decode_heic(Tensor encoded_data, int mode) -> Tensor",
@@ -1,7 +1,10 @@
 import csv
+import os
 import pathlib
-from typing import Any, Callable, Optional, Tuple, Union
+import tempfile
+from typing import Any, Callable, List, Optional, Tuple, Union
 
+import numpy as np
 import torch
 from PIL import Image
 
@@ -19,6 +22,11 @@ class FER2013(VisionDataset):
         ``train.csv`` and ``test.csv`` are present, the test labels are set to
         ``None``.
 
+    .. note::
+        The parsed images and labels of a split are cached as ``.npy`` files in ``root/fer2013/`` if the directory is
+        writable, which makes subsequent instantiations considerably faster. The cache is tied to the size and
+        modification time of the CSV file and is rebuilt if the file changes.
+
     Args:
         root (str or ``pathlib.Path``): Root directory of dataset where directory
             ``root/fer2013`` exists. This directory may contain either
@@ -32,6 +40,9 @@ class FER2013(VisionDataset):
         transform (callable, optional): A function/transform that takes in a PIL image and returns a transformed
             version. E.g, ``transforms.RandomCrop``
         target_transform (callable, optional): A function/transform that takes in the target and transforms it.
+        return_tensor (bool, optional): If ``True``, images are returned as ``uint8`` tensors of shape ``(1, 48, 48)``
+            instead of PIL images, which avoids the conversion to and from PIL when the transforms operate on
+            tensors. Default is ``False``.
     """
 
     _RESOURCES = {
@@ -58,14 +69,18 @@ class FER2013(VisionDataset):
         "icml": ("icml_face_data.csv", "b114b9e04e6949e5fe8b6a98b3892b1d"),
     }
 
+    _PARSE_CHUNK_SIZE = 1024
+
     def __init__(
         self,
         root: Union[str, pathlib.Path],
         split: str = "train",
         transform: Optional[Callable] = None,
         target_transform: Optional[Callable] = None,
+        return_tensor: bool = False,
     ) -> None:
         self._split = verify_str_arg(split, "split", ("train", "test"))
+        self._return_tensor = return_tensor
         super().__init__(root, transform=transform, target_transform=target_transform)
 
         base_folder = pathlib.Path(self.root) / "fer2013"
@@ -80,33 +95,107 @@ class FER2013(VisionDataset):
                 f"https://www.kaggle.com/c/challenges-in-representation-learning-facial-expression-recognition-challenge"
             )
 
+        # Parsing the CSV file is by far the most expensive part of the setup. Thus, the parsed split is cached next to
+        # it and memory-mapped on subsequent instantiations, so that only the pages of the accessed images are read.
+        # The size and modification time of the CSV file are part of the cache file names, so that a replaced or
+        # re-downloaded file never gets served from a stale cache.
+        stat = data_file.stat()
+        cache_prefix = f"{data_file.stem}_{self._split}"
+        cache_key = f"{cache_prefix}_{stat.st_size}_{stat.st_mtime_ns}"
+        images_file, labels_file = (base_folder / f"{cache_key}_{name}.npy" for name in ("images", "labels"))
+        if images_file.exists() and labels_file.exists():
+            images = np.load(images_file, mmap_mode="c")
+            self._labels = [None if label < 0 else int(label) for label in np.load(labels_file)]
+        else:
+            images, self._labels = self._read_csv(data_file, use_fer_file=use_fer_file, use_icml_file=use_icml_file)
+            # The cache is only an optimization. Thus, we don't even try to write it if the root is read-only.
+            if os.access(base_folder, os.W_OK):
+                # Caches of previous versions of the CSV file are removed, so they don't pile up
+                for stale_file in base_folder.glob(f"{cache_prefix}_*_*_*.npy"):
+                    self._remove(stale_file)
+                self._save_cache(images_file, images)
+                self._save_cache(labels_file, np.array([-1 if label is None else label for label in self._labels]))
+
+        # The images are stored with an explicit channel dimension, so tensor samples can be returned without reshaping
+        self._images = torch.from_numpy(images).unsqueeze(1)
+
+    def _read_csv(
+        self, data_file: pathlib.Path, *, use_fer_file: bool, use_icml_file: bool
+    ) -> Tuple[np.ndarray, List[Optional[int]]]:
         pixels_key = " pixels" if use_icml_file else "pixels"
         usage_key = " Usage" if use_icml_file else "Usage"
-
-        def get_img(row):
-            return torch.tensor([int(idx) for idx in row[pixels_key].split()], dtype=torch.uint8).reshape(48, 48)
-
-        def get_label(row):
-            if use_fer_file or use_icml_file or self._split == "train":
-                return int(row["emotion"])
-            else:
-                return None
+        has_labels = use_fer_file or use_icml_file or self._split == "train"
 
         with open(data_file, "r", newline="") as file:
-            rows = (row for row in csv.DictReader(file))
+            # The columns are looked up once in the header instead of building a dict for every row
+            rows = csv.reader(file)
+            header = next(rows)
+            pixels_idx = header.index(pixels_key)
+            emotion_idx = header.index("emotion") if has_labels else None
 
             if use_fer_file or use_icml_file:
+                usage_idx = header.index(usage_key)
                 valid_keys = ("Training",) if self._split == "train" else ("PublicTest", "PrivateTest")
-                rows = (row for row in rows if row[usage_key] in valid_keys)
-
-            self._samples = [(get_img(row), get_label(row)) for row in rows]
+                rows = (row for row in rows if row[usage_idx] in valid_keys)
+
+            # The pixel strings are parsed in chunks rather than all at once, so that only a bounded number of them
+            # is kept alive at any time next to the much more compact uint8 images.
+            chunks, pixels, labels = [], [], []
+            for row in rows:
+                pixels.append(row[pixels_idx])
+                labels.append(int(row[emotion_idx]) if emotion_idx is not None else None)
+                if len(pixels) == self._PARSE_CHUNK_SIZE:
+                    chunks.append(self._parse_pixels(pixels))
+                    pixels = []
+            chunks.append(self._parse_pixels(pixels))
+
+        return np.concatenate(chunks), labels
+
+    @classmethod
+    def _save_cache(cls, file: pathlib.Path, array: np.ndarray) -> None:
+        # Failing to write the cache, e.g. because the disk is full, is not an error. The array is written to a
+        # temporary file first to never leave a truncated cache behind. The temporary file is unique, since several
+        # processes, e.g. DDP ranks, might build the cache at the same time.
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=file.parent, prefix=f"{file.stem}_", suffix=".tmp")
+        except OSError:
+            return
+        tmp_file = pathlib.Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                np.save(fh, array)
+            os.replace(tmp_file, file)
+        except OSError:
+            cls._remove(tmp_file)
+
+    @staticmethod
+    def _remove(file: pathlib.Path) -> None:
+        try:
+            file.unlink()
+        except OSError:
+            pass
+
+    @staticmethod
+    def _parse_pixels(pixels: List[str]) -> np.ndarray:
+        # Parsing all rows in a single call keeps the per-pixel work out of the interpreter
+        return np.fromstring(" ".join(pixels), dtype=np.uint8, sep=" ").reshape(-1, 48, 48)
 
     def __len__(self) -> int:
-        return len(self._samples)
+        return len(self._labels)
 
     def __getitem__(self, idx: int) -> Tuple[Any, Any]:
-        image_tensor, target = self._samples[idx]
-        image = Image.fromarray(image_tensor.numpy())
+        return self.__getitems__([idx])[0]
+
+    def __getitems__(self, indices: List[int]) -> List[Tuple[Any, Any]]:
+        # Used by the DataLoader to fetch a whole batch at once: the images are gathered from the pixel block with a
+        # single indexing operation instead of one per sample.
+        # Indexing with a list always returns a copy, so transforms working in-place cannot alter the stored images.
+        images = self._images[indices]
+        return [self._make_sample(image, self._labels[idx]) for image, idx in zip(images, indices)]
+
+    def _make_sample(self, image: torch.Tensor, target: Any) -> Tuple[Any, Any]:
+        if not self._return_tensor:
+            image = Image.fromarray(image[0].numpy())
 
         if self.transform is not None:
             image = self.transform(image)
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from typing import Any, Callable, Optional, Tuple, Union
 
@@ -54,14 +55,25 @@ class RenderedSST2(VisionDataset):
         if not self._check_exists():
             raise RuntimeError("Dataset not found. You can use download=True to download it")
 
-        self._samples = make_dataset(str(self._base_folder / self._split_to_folder[self._split]), extensions=("png",))
+        # The classes are fixed, so there is no need to have make_dataset find them by scanning the folder again
+        self._samples = make_dataset(
+            str(self._base_folder / self._split_to_folder[self._split]),
+            class_to_idx=self.class_to_idx,
+            extensions=("png",),
+        )
 
     def __len__(self) -> int:
         return len(self._samples)
 
     def __getitem__(self, idx: int) -> Tuple[Any, Any]:
         image_file, label = self._samples[idx]
-        image = PIL.Image.open(image_file).convert("RGB")
+        image = PIL.Image.open(image_file)
+        # Converting always creates a copy, even if the image already is in RGB mode. Loading the image explicitly
+        # instead still reads the pixel data eagerly and closes the file, as the conversion does.
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        else:
+            image.load()
 
         if self.transform:
             image = self.transform(image)
@@ -75,10 +87,12 @@ class RenderedSST2(VisionDataset):
         return f"split={self._split}"
 
     def _check_exists(self) -> bool:
-        for class_label in set(self.classes):
-            if not (self._base_folder / self._split_to_folder[self._split] / class_label).is_dir():
-                return False
-        return True
+        try:
+            with os.scandir(self._base_folder / self._split_to_folder[self._split]) as entries:
+                class_folders = {entry.name for entry in entries if entry.is_dir()}
+        except OSError:
+            return False
+        return set(self.classes).issubset(class_folders)
 
     def _download(self) -> None:
         if self._check_exists():
@@ -154,16 +154,15 @@ class RandomClipSampler(Sampler):
         self.max_clips_per_video = max_clips_per_video
 
     def __iter__(self) -> Iterator[int]:
-        idxs = []
-        s = 0
-        # select at most max_clips_per_video for each video, randomly
-        for c in self.video_clips.clips:
-            length = len(c)
-            size = min(length, self.max_clips_per_video)
-            sampled = torch.randperm(length)[:size] + s
-            s += length
-            idxs.append(sampled)
-        idxs_ = torch.cat(idxs)
+        lengths = torch.as_tensor([len(c) for c in self.video_clips.clips], dtype=torch.long)
+        video_idxs = torch.repeat_interleave(torch.arange(len(lengths)), lengths)
+        # shuffle all clips and stably group them by video again, which leaves the clips of each video in random order
+        perm = torch.randperm(len(video_idxs))
+        idxs = perm[torch.argsort(video_idxs[perm], stable=True)]
+        # select at most max_clips_per_video for each video, i.e. the first ones of each group
+        starts = lengths.cumsum(0) - lengths
+        ranks = torch.arange(len(idxs)) - torch.repeat_interleave(starts, lengths)
+        idxs_ = idxs[ranks < self.max_clips_per_video]
         # shuffle all clips randomly
         perm = torch.randperm(len(idxs_))
         return iter(idxs_[perm].tolist())
@@ -1,11 +1,14 @@
 import bisect
 import math
+import os
 import warnings
 from fractions import Fraction
-from typing import Any, Callable, cast, Dict, List, Optional, Tuple, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
+import numpy as np
 import torch
-from torchvision.io import _probe_video_from_file, _read_video_from_file, read_video, read_video_timestamps
+from torchvision.io import _probe_video_from_file, _read_video_from_file, read_video_timestamps
+from torchvision.io.video import _read_video_pyav
 
 from .utils import tqdm
 
@@ -36,12 +39,9 @@ def unfold(tensor: torch.Tensor, size: int, step: int, dilation: int = 1) -> tor
     if tensor.dim() != 1:
         raise ValueError(f"tensor should have 1 dimension instead of {tensor.dim()}")
     o_stride = tensor.stride(0)
-    numel = tensor.numel()
-    new_stride = (step * o_stride, dilation * o_stride)
-    new_size = ((numel - (dilation * (size - 1) + 1)) // step + 1, size)
-    if new_size[0] < 1:
-        new_size = (0, size)
-    return torch.as_strided(tensor, new_size, new_stride)
+    numel = tensor.size(0)
+    num_windows = max((numel - (dilation * (size - 1) + 1)) // step + 1, 0)
+    return torch.as_strided(tensor, (num_windows, size), (step * o_stride, dilation * o_stride))
 
 
 class _VideoTimestampsDataset:
@@ -95,6 +95,10 @@ class VideoClips:
         num_workers (int): how many subprocesses to use for data loading.
             0 means that the data will be loaded in the main process. (default: 0)
         output_format (str): The format of the output video tensors. Can be either "THWC" (default) or "TCHW".
+        cache_path (str, optional): if specified, the timestamps of the videos are stored in this file and reused by
+            later instantiations. Only videos that were added or modified since then are decoded again.
+        read_audio (bool): whether to decode the audio of the clips. If ``False``, the audio stream is skipped and
+            an empty audio tensor is returned. (default: True)
     """
 
     def __init__(
@@ -112,10 +116,13 @@ class VideoClips:
         _audio_samples: int = 0,
         _audio_channels: int = 0,
         output_format: str = "THWC",
+        cache_path: Optional[str] = None,
+        read_audio: bool = True,
     ) -> None:
 
         self.video_paths = video_paths
         self.num_workers = num_workers
+        self.read_audio = read_audio
 
         # these options are not valid for pyav backend
         self._video_width = _video_width
@@ -128,23 +135,38 @@ class VideoClips:
         if self.output_format not in ("THWC", "TCHW"):
             raise ValueError(f"output_format should be either 'THWC' or 'TCHW', got {output_format}.")
 
-        if _precomputed_metadata is None:
-            self._compute_frame_pts()
-        else:
+        # Probing results of the video_reader backend, filled lazily by get_clip
+        self._video_info: Dict[int, Any] = {}
+
+        if _precomputed_metadata is not None:
             self._init_from_metadata(_precomputed_metadata)
+        elif cache_path is not None:
+            self._init_from_cache(cache_path)
+        else:
+            self._compute_frame_pts()
         self.compute_clips(clip_length_in_frames, frames_between_clips, frame_rate)
 
     def _compute_frame_pts(self) -> None:
-        self.video_pts = []  # len = num_videos. Each entry is a tensor of shape (num_frames_in_video,)
-        self.video_fps: List[float] = []  # len = num_videos
+        # len = num_videos. Each entry of video_pts is a tensor of shape (num_frames_in_video,)
+        self.video_pts, self.video_fps = self._read_frame_pts(self.video_paths)
+
+    def _read_frame_pts(self, video_paths: List[str]) -> Tuple[List[torch.Tensor], List[float]]:
+        video_pts: List[torch.Tensor] = []
+        video_fps: List[float] = []
 
         # strategy: use a DataLoader to parallelize read_video_timestamps
         # so need to create a dummy dataset first
         import torch.utils.data
 
+        # Each batch is read by a single worker. Thus, for a small number of videos the batches are made smaller, so
+        # that all workers get a share of the videos instead of the first few workers reading all of them.
+        batch_size = 16
+        if self.num_workers > 0:
+            batch_size = max(min(batch_size, math.ceil(len(video_paths) / self.num_workers)), 1)
+
         dl: torch.utils.data.DataLoader = torch.utils.data.DataLoader(
-            _VideoTimestampsDataset(self.video_paths),  # type: ignore[arg-type]
-            batch_size=16,
+            _VideoTimestampsDataset(video_paths),  # type: ignore[arg-type]
+            batch_size=batch_size,
             num_workers=self.num_workers,
             collate_fn=_collate_fn,
         )
@@ -153,12 +175,40 @@ class VideoClips:
             for batch in dl:
                 pbar.update(1)
                 batch_pts, batch_fps = list(zip(*batch))
-                # we need to specify dtype=torch.long because for empty list,
-                # torch.as_tensor will use torch.float as default dtype. This
-                # happens when decoding fails and no pts is returned in the list.
-                batch_pts = [torch.as_tensor(pts, dtype=torch.long) for pts in batch_pts]
-                self.video_pts.extend(batch_pts)
-                self.video_fps.extend(batch_fps)
+                # we need to specify the dtype because for an empty list, the
+                # default would be a floating point one. This happens when
+                # decoding fails and no pts is returned in the list. The lists
+                # are converted by numpy, which is considerably faster than
+                # torch.as_tensor for long lists of Python ints.
+                batch_pts = [torch.from_numpy(np.asarray(pts, dtype=np.int64)) for pts in batch_pts]
+                video_pts.extend(batch_pts)
+                video_fps.extend(batch_fps)
+
+        return video_pts, video_fps
+
+    def _init_from_cache(self, cache_path: str) -> None:
+        # The entries are keyed by the path together with the modification time and size of the video, so that videos
+        # which changed since they were cached are decoded again.
+        keys = []
+        for path in self.video_paths:
+            stat = os.stat(path)
+            keys.append((path, stat.st_mtime_ns, stat.st_size))
+
+        entries = {}
+        if os.path.exists(cache_path):
+            cache = torch.load(cache_path, weights_only=True)
+            entries = dict(zip(map(tuple, cache["keys"]), zip(cache["video_pts"], cache["video_fps"])))
+
+        missing_keys = [key for key in keys if key not in entries]
+        if missing_keys:
+            video_pts, video_fps = self._read_frame_pts([path for path, _, _ in missing_keys])
+            entries.update(zip(missing_keys, zip(video_pts, video_fps)))
+
+        self.video_pts = [entries[key][0] for key in keys]
+        self.video_fps = [entries[key][1] for key in keys]
+
+        if missing_keys:
+            torch.save({"keys": keys, "video_pts": self.video_pts, "video_fps": self.video_fps}, cache_path)
 
     def _init_from_metadata(self, metadata: Dict[str, Any]) -> None:
         self.video_paths = metadata["video_paths"]
@@ -199,6 +249,7 @@ class VideoClips:
             _audio_samples=self._audio_samples,
             _audio_channels=self._audio_channels,
             output_format=self.output_format,
+            read_audio=self.read_audio,
         )
 
     @staticmethod
@@ -247,9 +298,15 @@ class VideoClips:
             clips, idxs = self.compute_clips_for_video(video_pts, num_frames, step, fps, frame_rate)
             self.clips.append(clips)
             self.resampling_idxs.append(idxs)
+        self._compute_clip_bounds()
         clip_lengths = torch.as_tensor([len(v) for v in self.clips])
         self.cumulative_sizes = clip_lengths.cumsum(0).tolist()
 
+    def _compute_clip_bounds(self) -> None:
+        # get_clip only needs the first and last pts of a clip. Keeping them as plain arrays avoids indexing the clip
+        # tensors and calling .item() twice per fetched clip.
+        self._clip_bounds = [clips[:, [0, -1]].numpy() for clips in self.clips]
+
     def __len__(self) -> int:
         return self.num_clips()
 
@@ -303,7 +360,7 @@ class VideoClips:
             raise IndexError(f"Index {idx} out of range ({self.num_clips()} number of clips)")
         video_idx, clip_idx = self.get_clip_location(idx)
         video_path = self.video_paths[video_idx]
-        clip_pts = self.clips[video_idx][clip_idx]
+        clip_start_pts, clip_end_pts = self._clip_bounds[video_idx][clip_idx].tolist()
 
         from torchvision import get_video_backend
 
@@ -323,21 +380,22 @@ class VideoClips:
                 raise ValueError("pyav backend doesn't support _audio_samples != 0")
 
         if backend == "pyav":
-            start_pts = clip_pts[0].item()
-            end_pts = clip_pts[-1].item()
-            video, audio, info = read_video(video_path, start_pts, end_pts)
+            video, audio, info = _read_video_pyav(video_path, clip_start_pts, clip_end_pts, read_audio=self.read_audio)
         else:
-            _info = _probe_video_from_file(video_path)
+            # The metadata of a video is the same for all of its clips, so it is only probed for the first one
+            _info = self._video_info.get(video_idx)
+            if _info is None:
+                _info = self._video_info[video_idx] = _probe_video_from_file(video_path)
             video_fps = _info.video_fps
             audio_fps = None
 
-            video_start_pts = cast(int, clip_pts[0].item())
-            video_end_pts = cast(int, clip_pts[-1].item())
+            video_start_pts = clip_start_pts
+            video_end_pts = clip_end_pts
 
             audio_start_pts, audio_end_pts = 0, -1
             audio_timebase = Fraction(0, 1)
             video_timebase = Fraction(_info.video_timebase.numerator, _info.video_timebase.denominator)
-            if _info.has_audio:
+            if self.read_audio and _info.has_audio:
                 audio_timebase = Fraction(_info.audio_timebase.numerator, _info.audio_timebase.denominator)
                 audio_start_pts = pts_convert(video_start_pts, video_timebase, audio_timebase, math.floor)
                 audio_end_pts = pts_convert(video_end_pts, video_timebase, audio_timebase, math.ceil)
@@ -350,6 +408,7 @@ class VideoClips:
                 video_max_dimension=self._video_max_dimension,
                 video_pts_range=(video_start_pts, video_end_pts),
                 video_timebase=video_timebase,
+                read_audio_stream=self.read_audio,
                 audio_samples=self._audio_samples,
                 audio_channels=self._audio_channels,
                 audio_pts_range=(audio_start_pts, audio_end_pts),
@@ -397,6 +456,8 @@ class VideoClips:
         del d["clips"]
         del d["resampling_idxs"]
         del d["cumulative_sizes"]
+        d.pop("_clip_bounds", None)
+        d.pop("_video_info", None)
 
         # for backwards-compatibility
         d["_version"] = 2
@@ -404,8 +465,11 @@ class VideoClips:
 
     def __setstate__(self, d: Dict[str, Any]) -> None:
         # for backwards-compatibility
+        d["_video_info"] = {}
+        d.setdefault("read_audio", True)
         if "_version" not in d:
             self.__dict__ = d
+            self._compute_clip_bounds()
             return
 
         video_pts = torch.as_tensor(d["video_pts"], dtype=torch.int64)
@@ -4,6 +4,7 @@ from pathlib import Path
 
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import torch
 from PIL import Image
 
@@ -132,13 +133,14 @@ class WIDERFace(VisionDataset):
                     box_annotation_line = True
                 elif box_annotation_line:
                     box_counter += 1
-                    line_split = line.split(" ")
-                    line_values = [int(x) for x in line_split]
-                    labels.append(line_values)
+                    labels.append(line)
                     if box_counter >= num_boxes:
                         box_annotation_line = False
                         file_name_line = True
-                        labels_tensor = torch.tensor(labels)
+                        # all box annotations of the image are parsed at once rather than value by value
+                        labels_tensor = torch.from_numpy(
+                            np.fromstring(" ".join(labels), dtype=np.int64, sep=" ").reshape(len(labels), -1)
+                        )
                         self.img_info.append(
                             {
                                 "img_path": img_path,
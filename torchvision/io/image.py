@@ -164,8 +164,9 @@ def decode_jpeg(
     The values of the output tensor are uint8 between 0 and 255.
 
     .. note::
-        When using a CUDA device, passing a list of tensors is more efficient than repeated individual calls to ``decode_jpeg``.
-        When using CPU the performance is equivalent.
+        Passing a list of tensors is more efficient than repeated individual calls to ``decode_jpeg``.
+        When using a CUDA device, the images are decoded as a batch. When using CPU, they are decoded in parallel on
+        the intra-op thread pool, see :func:`torch.set_num_threads`.
         The CUDA version of this function has explicitly been designed with thread-safety in mind.
         This function does not return partial results in case of an error.
 
@@ -213,7 +214,7 @@ def decode_jpeg(
         if device.type == "cuda":
             return torch.ops.image.decode_jpegs_cuda(input, mode.value, device)
         else:
-            return [torch.ops.image.decode_jpeg(img, mode.value, apply_exif_orientation) for img in input]
+            return torch.ops.image.decode_jpegs(input, mode.value, apply_exif_orientation)
 
     else:  # input is tensor
         if input.device.type != "cpu":
@@ -14,10 +14,24 @@ from .vgg import *
 from .vision_transformer import *
 from .swin_transformer import *
 from .maxvit import *
-from . import detection, optical_flow, quantization, segmentation, video
 
 # The Weights and WeightsEnum are developer-facing utils that we make public for
 # downstream libs like torchgeo https://github.com/pytorch/vision/issues/7094
 # TODO: we could / should document them publicly, but it's not clear where, as
 # they're not intended for end users.
 from ._api import get_model, get_model_builder, get_model_weights, get_weight, list_models, Weights, WeightsEnum
+
+
+# The model subpackages below are only imported on first access, since importing them is comparatively expensive and
+# most users only need a few of the classification models.
+# Ref: https://peps.python.org/pep-0562/
+_LAZY_SUBMODULES = ("detection", "optical_flow", "quantization", "segmentation", "video")
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        import importlib
+
+        return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
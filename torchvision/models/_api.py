@@ -120,8 +120,7 @@ def get_weight(name: str) -> WeightsEnum:
     except ValueError:
         raise ValueError(f"Invalid weight name provided: '{name}'.")
 
-    base_module_name = ".".join(sys.modules[__name__].__name__.split(".")[:-1])
-    base_module = importlib.import_module(base_module_name)
+    base_module = _import_builtin_models()
     model_modules = [base_module] + [
         x[1]
         for x in inspect.getmembers(base_module, inspect.ismodule)
@@ -193,6 +192,16 @@ M = TypeVar("M", bound=nn.Module)
 BUILTIN_MODELS = {}
 
 
+def _import_builtin_models() -> ModuleType:
+    # Some of the model subpackages are only imported on first access. Since models are registered when their module is
+    # imported, all of them need to be imported before looking up weights or models by name.
+    base_module_name = ".".join(sys.modules[__name__].__name__.split(".")[:-1])
+    base_module = importlib.import_module(base_module_name)
+    for name in getattr(base_module, "_LAZY_SUBMODULES", ()):
+        importlib.import_module(f".{name}", base_module_name)
+    return base_module
+
+
 def register_model(name: Optional[str] = None) -> Callable[[Callable[..., M]], Callable[..., M]]:
     def wrapper(fn: Callable[..., M]) -> Callable[..., M]:
         key = name if name is not None else fn.__name__
@@ -224,6 +233,7 @@ def list_models(
     Returns:
         models (list): A list with the names of available models.
     """
+    _import_builtin_models()
     all_models = {
         k for k, v in BUILTIN_MODELS.items() if module is None or v.__module__.rsplit(".", 1)[0] == module.__name__
     }
@@ -254,6 +264,7 @@ def get_model_builder(name: str) -> Callable[..., nn.Module]:
     Returns:
         fn (Callable): The model builder method.
     """
+    _import_builtin_models()
     name = name.lower()
     try:
         fn = BUILTIN_MODELS[name]
@@ -1,3 +1,4 @@
+import os
 import pathlib
 import re
 from typing import Any, BinaryIO, Dict, List, Tuple, Union
@@ -20,6 +21,12 @@ from torchvision.tv_tensors import BoundingBoxes
 from .._api import register_dataset, register_info
 
 
+def _split_path(path: str) -> Tuple[str, str]:
+    # The key and filter functions run for every file in the archives, so we avoid constructing a pathlib.Path each time
+    head, name = os.path.split(path)
+    return os.path.basename(head), name
+
+
 @register_info("caltech101")
 def _caltech101_info() -> Dict[str, Any]:
     return dict(categories=read_categories_file("caltech101"))
@@ -39,6 +46,9 @@ class Caltech101(Dataset):
         skip_integrity_check: bool = False,
     ) -> None:
         self._categories = _caltech101_info()["categories"]
+        # The bounding boxes need the size of the image, which is read from its header. Since the files never change, it
+        # is kept per path so that later epochs do not have to open the encoded image again.
+        self._spatial_sizes: Dict[str, Tuple[int, int]] = {}
 
         super().__init__(
             root,
@@ -70,29 +80,26 @@ class Caltech101(Dataset):
     }
 
     def _is_not_background_image(self, data: Tuple[str, Any]) -> bool:
-        path = pathlib.Path(data[0])
-        return path.parent.name != "BACKGROUND_Google"
+        category, _ = _split_path(data[0])
+        return category != "BACKGROUND_Google"
 
     def _is_ann(self, data: Tuple[str, Any]) -> bool:
-        path = pathlib.Path(data[0])
-        return bool(self._ANNS_NAME_PATTERN.match(path.name))
+        _, name = _split_path(data[0])
+        return bool(self._ANNS_NAME_PATTERN.match(name))
 
     def _images_key_fn(self, data: Tuple[str, Any]) -> Tuple[str, str]:
-        path = pathlib.Path(data[0])
+        category, name = _split_path(data[0])
 
-        category = path.parent.name
-        id = self._IMAGES_NAME_PATTERN.match(path.name).group("id")  # type: ignore[union-attr]
+        id = self._IMAGES_NAME_PATTERN.match(name).group("id")  # type: ignore[union-attr]
 
         return category, id
 
     def _anns_key_fn(self, data: Tuple[str, Any]) -> Tuple[str, str]:
-        path = pathlib.Path(data[0])
+        category, name = _split_path(data[0])
 
-        category = path.parent.name
-        if category in self._ANNS_CATEGORY_MAP:
-            category = self._ANNS_CATEGORY_MAP[category]
+        category = self._ANNS_CATEGORY_MAP.get(category, category)
 
-        id = self._ANNS_NAME_PATTERN.match(path.name).group("id")  # type: ignore[union-attr]
+        id = self._ANNS_NAME_PATTERN.match(name).group("id")  # type: ignore[union-attr]
 
         return category, id
 
@@ -107,6 +114,10 @@ class Caltech101(Dataset):
         image = EncodedImage.from_file(image_buffer)
         ann = read_mat(ann_buffer)
 
+        spatial_size = self._spatial_sizes.get(image_path)
+        if spatial_size is None:
+            spatial_size = self._spatial_sizes[image_path] = image.spatial_size
+
         return dict(
             label=Label.from_category(category, categories=self._categories),
             image_path=image_path,
@@ -115,7 +126,7 @@ class Caltech101(Dataset):
             bounding_boxes=BoundingBoxes(
                 ann["box_coord"].astype(np.int64).squeeze()[[2, 0, 3, 1]],
                 format="xyxy",
-                spatial_size=image.spatial_size,
+                spatial_size=spatial_size,
             ),
             contour=torch.as_tensor(ann["obj_contour"].T),
         )
@@ -181,8 +192,8 @@ class Caltech256(Dataset):
         ]
 
     def _is_not_rogue_file(self, data: Tuple[str, Any]) -> bool:
-        path = pathlib.Path(data[0])
-        return path.name != "RENAME2"
+        _, name = _split_path(data[0])
+        return name != "RENAME2"
 
     def _prepare_sample(self, data: Tuple[str, BinaryIO]) -> Dict[str, Any]:
         path, buffer = data
@@ -190,7 +201,7 @@ class Caltech256(Dataset):
         return dict(
             path=path,
             image=EncodedImage.from_file(buffer),
-            label=Label(int(pathlib.Path(path).parent.name.split(".", 1)[0]) - 1, categories=self._categories),
+            label=Label(int(_split_path(path)[0].split(".", 1)[0]) - 1, categories=self._categories),
         )
 
     def _datapipe(self, resource_dps: List[IterDataPipe]) -> IterDataPipe[Dict[str, Any]]:
@@ -213,7 +213,7 @@ class _BaseMixUpCutMix(Transform):
             label = one_hot(label, num_classes=self.num_classes)  # type: ignore[arg-type]
         if not label.dtype.is_floating_point:
             label = label.float()
-        return label.roll(1, 0).mul_(1.0 - lam).add_(label.mul(lam))
+        return torch.lerp(label.roll(1, 0), label, lam)
 
 
 class MixUp(_BaseMixUpCutMix):
@@ -254,7 +254,8 @@ class MixUp(_BaseMixUpCutMix):
         elif isinstance(inpt, (tv_tensors.Image, tv_tensors.Video)) or is_pure_tensor(inpt):
             self._check_image_or_video(inpt, batch_size=params["batch_size"])
 
-            output = inpt.roll(1, 0).mul_(1.0 - lam).add_(inpt.mul(lam))
+            # lam * inpt + (1 - lam) * rolled in a single kernel
+            output = torch.lerp(inpt.roll(1, 0), inpt, lam)
 
             if isinstance(inpt, (tv_tensors.Image, tv_tensors.Video)):
                 output = tv_tensors.wrap(output, like=inpt)
@@ -321,9 +322,9 @@ class CutMix(_BaseMixUpCutMix):
             self._check_image_or_video(inpt, batch_size=params["batch_size"])
 
             x1, y1, x2, y2 = params["box"]
-            rolled = inpt.roll(1, 0)
             output = inpt.clone()
-            output[..., y1:y2, x1:x2] = rolled[..., y1:y2, x1:x2]
+            # Only the pasted box is needed from the rolled batch, so there is no need to roll the whole input
+            output[..., y1:y2, x1:x2] = inpt[..., y1:y2, x1:x2].roll(1, 0)
 
             if isinstance(inpt, (tv_tensors.Image, tv_tensors.Video)):
                 output = tv_tensors.wrap(output, like=inpt)
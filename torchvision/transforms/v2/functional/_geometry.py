@@ -73,7 +73,8 @@ def horizontal_flip_bounding_boxes(
     bounding_boxes = bounding_boxes.clone().reshape(-1, 4)
 
     if format == tv_tensors.BoundingBoxFormat.XYXY:
-        bounding_boxes[:, [2, 0]] = bounding_boxes[:, [0, 2]].sub_(canvas_size[1]).neg_()
+        # x1, x2 = W - x2, W - x1. Strided slices + flip avoid the index tensors of advanced indexing
+        bounding_boxes[:, 0::2] = bounding_boxes[:, 0::2].flip(-1).sub_(canvas_size[1]).neg_()
     elif format == tv_tensors.BoundingBoxFormat.XYWH:
         bounding_boxes[:, 0].add_(bounding_boxes[:, 2]).sub_(canvas_size[1]).neg_()
     else:  # format == tv_tensors.BoundingBoxFormat.CXCYWH:
@@ -130,7 +131,8 @@ def vertical_flip_bounding_boxes(
     bounding_boxes = bounding_boxes.clone().reshape(-1, 4)
 
     if format == tv_tensors.BoundingBoxFormat.XYXY:
-        bounding_boxes[:, [1, 3]] = bounding_boxes[:, [3, 1]].sub_(canvas_size[0]).neg_()
+        # y1, y2 = H - y2, H - y1. Strided slices + flip avoid the index tensors of advanced indexing
+        bounding_boxes[:, 1::2] = bounding_boxes[:, 1::2].flip(-1).sub_(canvas_size[0]).neg_()
     elif format == tv_tensors.BoundingBoxFormat.XYWH:
         bounding_boxes[:, 1].add_(bounding_boxes[:, 3]).sub_(canvas_size[0]).neg_()
     else:  # format == tv_tensors.BoundingBoxFormat.CXCYWH:
@@ -1331,16 +1333,17 @@ def pad_bounding_boxes(
 
     left, right, top, bottom = _parse_pad_padding(padding)
 
-    if format == tv_tensors.BoundingBoxFormat.XYXY:
-        pad = [left, top, left, top]
-    else:
-        pad = [left, top, 0, 0]
-    bounding_boxes = bounding_boxes + torch.tensor(pad, dtype=bounding_boxes.dtype, device=bounding_boxes.device)
+    # Padding only on the right and bottom, e.g. when padding to a fixed size, doesn't move the boxes. Skipping the
+    # offset in that case also avoids creating a small tensor on the boxes' device.
+    if left != 0 or top != 0:
+        if format == tv_tensors.BoundingBoxFormat.XYXY:
+            pad = [left, top, left, top]
+        else:
+            pad = [left, top, 0, 0]
+        bounding_boxes = bounding_boxes + torch.tensor(pad, dtype=bounding_boxes.dtype, device=bounding_boxes.device)
 
     height, width = canvas_size
-    height += top + bottom
-    width += left + right
-    canvas_size = (height, width)
+    canvas_size = (height + top + bottom, width + left + right)
 
     return clamp_bounding_boxes(bounding_boxes, format=format, canvas_size=canvas_size), canvas_size
 
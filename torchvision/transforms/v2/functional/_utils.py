@@ -1,5 +1,5 @@
 import functools
-from typing import Any, Callable, Dict, List, Optional, Sequence, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
 
 import torch
 from torchvision import tv_tensors
@@ -14,6 +14,9 @@ def is_pure_tensor(inpt: Any) -> bool:
 
 # {functional: {input_type: type_specific_kernel}}
 _KERNEL_REGISTRY: Dict[Callable, Dict[Type, Callable]] = {}
+# {(functional, input_type): type_specific_kernel}. Memoizes the MRO walk in _get_kernel, since it happens on every
+# functional call. Needs to be cleared whenever a kernel is registered.
+_KERNEL_CACHE: Dict[Tuple[Callable, Type], Callable] = {}
 
 
 def _kernel_tv_tensor_wrapper(kernel):
@@ -45,6 +48,7 @@ def _register_kernel_internal(functional, input_type, *, tv_tensor_wrapper=True)
             if issubclass(input_type, tv_tensors.TVTensor) and tv_tensor_wrapper
             else kernel
         )
+        _KERNEL_CACHE.clear()
         return kernel
 
     return decorator
@@ -96,13 +100,18 @@ def register_kernel(functional, tv_tensor_cls):
 
 
 def _get_kernel(functional, input_type, *, allow_passthrough=False):
+    kernel = _KERNEL_CACHE.get((functional, input_type))
+    if kernel is not None:
+        return kernel
+
     registry = _KERNEL_REGISTRY.get(functional)
     if not registry:
         raise ValueError(f"No kernel registered for functional {functional.__name__}.")
 
     for cls in input_type.__mro__:
         if cls in registry:
-            return registry[cls]
+            kernel = _KERNEL_CACHE[(functional, input_type)] = registry[cls]
+            return kernel
         elif cls is tv_tensors.TVTensor:
             # We don't want user-defined tv_tensors to dispatch to the pure Tensor kernels, so we explicit stop the
             # MRO traversal before hitting torch.Tensor. We can even stop at tv_tensors.TVTensor, since we don't
@@ -136,6 +145,7 @@ def _register_five_ten_crop_kernel_internal(functional, input_type):
 
     def decorator(kernel):
         registry[input_type] = wrap(kernel) if issubclass(input_type, tv_tensors.TVTensor) else kernel
+        _KERNEL_CACHE.clear()
         return kernel
 
     return decorator
@@ -11,6 +11,12 @@ from torchvision.tv_tensors._torch_function_helpers import _FORCE_TORCHFUNCTION_
 
 D = TypeVar("D", bound="TVTensor")
 
+# Getters of the base class descriptors, so the properties on TVTensor below don't need a super() lookup per access
+_get_shape = torch.Tensor.shape.__get__
+_get_ndim = torch.Tensor.ndim.__get__
+_get_device = torch.Tensor.device.__get__
+_get_dtype = torch.Tensor.dtype.__get__
+
 
 class TVTensor(torch.Tensor):
     """Base class for all TVTensors.
@@ -29,7 +35,14 @@ class TVTensor(torch.Tensor):
     ) -> torch.Tensor:
         if requires_grad is None:
             requires_grad = data.requires_grad if isinstance(data, torch.Tensor) else False
-        return torch.as_tensor(data, dtype=dtype, device=device).requires_grad_(requires_grad)
+        if type(data) is torch.Tensor and dtype is None and device is None:
+            # torch.as_tensor would return the same tensor, so we can skip the dispatch
+            tensor = data
+        else:
+            tensor = torch.as_tensor(data, dtype=dtype, device=device)
+        if tensor.requires_grad != requires_grad:
+            tensor.requires_grad_(requires_grad)
+        return tensor
 
     @classmethod
     def _wrap_output(
@@ -74,10 +87,9 @@ class TVTensor(torch.Tensor):
         # Like in the base Tensor.__torch_function__ implementation, it's easier to always use
         # DisableTorchFunctionSubclass and then manually re-wrap the output if necessary
         with DisableTorchFunctionSubclass():
-            output = func(*args, **kwargs or dict())
+            output = func(*args, **kwargs) if kwargs else func(*args)
 
-        must_return_subclass = _must_return_subclass()
-        if must_return_subclass or (func in _FORCE_TORCHFUNCTION_SUBCLASS and isinstance(args[0], cls)):
+        if _must_return_subclass() or (func in _FORCE_TORCHFUNCTION_SUBCLASS and isinstance(args[0], cls)):
             # If you're wondering why we need the `isinstance(args[0], cls)` check, remove it and see what fails
             # in test_to_tv_tensor_reference().
             # The __torch_function__ protocol will invoke the __torch_function__ method on *all* types involved in
@@ -87,7 +99,7 @@ class TVTensor(torch.Tensor):
             # be wrapped into an `Image`.
             return cls._wrap_output(output, args, kwargs)
 
-        if not must_return_subclass and isinstance(output, cls):
+        if isinstance(output, cls):
             # DisableTorchFunctionSubclass is ignored by inplace ops like `.add_(...)`,
             # so for those, the output is still a TVTensor. Thus, we need to manually unwrap.
             return output.as_subclass(torch.Tensor)
@@ -105,22 +117,22 @@ class TVTensor(torch.Tensor):
     @property
     def shape(self) -> _size:  # type: ignore[override]
         with DisableTorchFunctionSubclass():
-            return super().shape
+            return _get_shape(self)
 
     @property
     def ndim(self) -> int:  # type: ignore[override]
         with DisableTorchFunctionSubclass():
-            return super().ndim
+            return _get_ndim(self)
 
     @property
     def device(self, *args: Any, **kwargs: Any) -> _device:  # type: ignore[override]
         with DisableTorchFunctionSubclass():
-            return super().device
+            return _get_device(self)
 
     @property
     def dtype(self) -> _dtype:  # type: ignore[override]
         with DisableTorchFunctionSubclass():
-            return super().dtype
+            return _get_dtype(self)
 
     def __deepcopy__(self: D, memo: Dict[int, Any]) -> D:
         # We need to detach first, since a plain `Tensor.clone` will be part of the computation graph, which does